@@ -9,22 +9,41 @@ __requires__ = [
     'types-python-dateutil; extra=="test"',
 ]
 
+import abc
+import array
+import bisect
+import calendar
+import collections
+import contextlib
 import datetime
 import decimal
+import fractions
 import functools
+import heapq
+import itertools
+import math
 import numbers
+import operator
 import re
 import time
-from collections.abc import Iterable, Iterator, Sequence
-from typing import TYPE_CHECKING, Any, cast
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 
-import dateutil.parser
-import dateutil.tz
 from jaraco.collections import RangeMap
 
 if TYPE_CHECKING:
+    import concurrent.futures
     from typing import TypeAlias
 
+_T = TypeVar('_T')
+
 # some useful constants
 osc_per_year = 290_091_329_207_984_000
 """
@@ -142,25 +161,276 @@ def strftime(fmt: str, t: AnyDatetime | tuple[int, ...] | time.struct_time) -> s
     >>> strftime('%Y', datetime.time())
     '1900'
     """
-    t = infer_datetime(t)
-    subs = (
-        ('%s', f'{t.microsecond // 1000:03d}'),
-        ('%µ', f'{t.microsecond % 1000:03d}'),
-    ) + (('%Y', f'{t.year:04d}'),) * _needs_year_help()
+    return compile_strftime(fmt)(t)
+
+
+_strftime_directive = re.compile('%(.?)', re.DOTALL)
+
+_strftime_fields = {
+    'Y': '{0.year:04d}',
+    'm': '{0.month:02d}',
+    'd': '{0.day:02d}',
+    'H': '{0.hour:02d}',
+    'M': '{0.minute:02d}',
+    'S': '{0.second:02d}',
+    'f': '{0.microsecond:06d}',
+    's': '{1:03d}',
+    'µ': '{2:03d}',
+    '%': '%',
+}
+"""
+Directives rendered directly from the datetime (or its milliseconds
+and remaining microseconds), independent of locale and platform.
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def compile_strftime(fmt: str) -> Callable[[AnyDatetime | StructDatetime], str]:
+    """
+    Analyze fmt once, returning a function that renders values
+    as :func:`strftime` would.
+
+    >>> render = compile_strftime('%Y-%m-%d %H:%M:%S.%s')
+    >>> render(datetime.datetime(1976, 5, 7, 12, 30, 15, 20000))
+    '1976-05-07 12:30:15.020'
+    >>> render((900, 1, 1))
+    '0900-01-01 00:00:00.000'
+
+    Numeric fields are rendered directly; formats with other
+    directives (such as names and offsets) are rendered by the
+    stdlib after substituting the portable directives.
+
+    >>> compile_strftime('%a, %d %b %Y {%%s is %s}')(datetime.date(1976, 5, 7))
+    'Fri, 07 May 1976 {%s is 000}'
+
+    Compiled formats are cached (and used by :func:`strftime`).
+
+    >>> compile_strftime('%Y') is compile_strftime('%Y')
+    True
+    """
+    custom = {'s': '{1:03d}', 'µ': '{2:03d}'}
+    if _needs_year_help():
+        custom['Y'] = '{0.year:04d}'
+    direct: list[str] | None = []
+    stdlib = []
+    start = 0
+    for match in _strftime_directive.finditer(fmt):
+        literal = _format_literal(fmt[start : match.start()])
+        directive = match.group(1)
+        field = _strftime_fields.get(directive)
+        if direct is not None and field is not None:
+            direct += [literal, field]
+        else:
+            direct = None
+        stdlib += [literal, custom.get(directive) or _format_literal(match.group())]
+        start = match.end()
+    literal = _format_literal(fmt[start:])
+    if direct is not None:
+        return functools.partial(_render_direct, ''.join(direct + [literal]).format)
+    return functools.partial(_render_stdlib, ''.join(stdlib + [literal]).format)
+
+
+def _format_literal(text: str) -> str:
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def _render_direct(render: Callable[..., str], t: AnyDatetime | StructDatetime) -> str:
+    if not isinstance(t, datetime.datetime):
+        t = infer_datetime(t)
+    return render(t, t.microsecond // 1000, t.microsecond % 1000)
+
+
+def _render_stdlib(render: Callable[..., str], t: AnyDatetime | StructDatetime) -> str:
+    if not isinstance(t, datetime.datetime):
+        t = infer_datetime(t)
+    return t.strftime(render(t, t.microsecond // 1000, t.microsecond % 1000))
+
+
+_strftime_flagged = re.compile(r'%([-_0^#]*)(.?)', re.DOTALL)
+
+_strftime_hourly = set('YmdHIpaAbBhyCjUWVGguweDFxzZktln%')
+"""
+Directives whose rendering is fixed within an hour of wall time
+(at a fixed offset).
+"""
+
+_strftime_row_fields = {
+    'M': '{0:02d}',
+    'S': '{1:02d}',
+    'f': '{2:06d}',
+    's': '{3:03d}',
+    'µ': '{4:03d}',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _split_strftime(fmt: str) -> list[tuple[bool, str]] | None:
+    """
+    Split fmt into segments that are the same for every value within
+    an hour (flagged True, as strftime formats) and segments that vary
+    (as templates over minute, second, microsecond, millisecond and
+    remaining microseconds). Return None if a directive varies within
+    the hour but isn't one of those fields.
+
+    >>> _split_strftime('%Y-%m-%d %H:%M:%S.%s %Z')
+    [(True, '%Y-%m-%d %H'), (False, ':{0:02d}:{1:02d}.{3:03d}'), (True, ' %Z')]
+    >>> _split_strftime('%c')
+    """
+    segments: list[tuple[bool, str]] = []
+    start = 0
+    for match in _strftime_flagged.finditer(fmt):
+        flags, directive = match.groups()
+        literal = fmt[start : match.start()]
+        start = match.end()
+        if directive in _strftime_hourly:
+            segments.append((True, literal + match.group()))
+        elif not flags and directive in _strftime_row_fields:
+            field = _strftime_row_fields[directive]
+            segments.append((False, _format_literal(literal) + field))
+        else:
+            return None
+    segments.append((True, fmt[start:]))
+    merged = (
+        (hourly, ''.join(text for _, text in group))
+        for hourly, group in itertools.groupby(segments, key=operator.itemgetter(0))
+    )
+    return [(hourly, text) for hourly, text in merged if text]
+
+
+def _strftime_row(
+    segments: list[tuple[bool, str]], t: datetime.datetime
+) -> Callable[..., str]:
+    """
+    Render the hourly segments for t, returning a function of the
+    remaining fields.
+    """
+    return ''.join(
+        _format_literal(compile_strftime(text)(t)) if hourly else text
+        for hourly, text in segments
+    ).format
+
+
+_epoch_scale = dict(s=1, ms=10**3, us=10**6, ns=10**9)
+
+
+def _get_epoch_scale(unit: str) -> int:
+    """
+    Return the number of ``unit`` in a second.
+
+    >>> _get_epoch_scale('ms')
+    1000
+    >>> _get_epoch_scale('min')
+    Traceback (most recent call last):
+    ...
+    ValueError: unit not in (s, ms, us, ns)
+    """
+    try:
+        return _epoch_scale[unit]
+    except KeyError:
+        raise ValueError("unit not in (s, ms, us, ns)")
+
 
-    def doSub(s: str, sub: tuple[str, str]) -> str:
-        return s.replace(*sub)
+_utc_epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
 
-    def doSubs(s: str) -> str:
-        return functools.reduce(doSub, subs, s)
 
-    fmt = '%%'.join(map(doSubs, fmt.split('%%')))
-    return t.strftime(fmt)
+def strftime_many(
+    fmt: str,
+    values: Iterable[AnyDatetime | StructDatetime] | Iterable[int],
+    unit: str | None = None,
+    tz: datetime.tzinfo = datetime.timezone.utc,
+) -> list[str]:
+    """
+    Format each of values as :func:`strftime` would, compiling fmt
+    once and rendering the date and hour only when they change.
+
+    >>> values = [datetime.datetime(2024, 7, 26, 12, minute) for minute in (0, 30)]
+    >>> strftime_many('%a %Y-%m-%d %H:%M:%S.%s', values)
+    ['Fri 2024-07-26 12:00:00.000', 'Fri 2024-07-26 12:30:00.000']
+
+    Given a ``unit`` (``s``, ``ms``, ``us`` or ``ns``), values are
+    integer offsets from the epoch, rendered in ``tz`` (UTC by default)
+    without constructing a datetime for each.
+
+    >>> stamps = array.array('q', [1721998740, 1721998800])
+    >>> strftime_many('%Y-%m-%d %H:%M:%S %z', stamps, unit='s')
+    ['2024-07-26 12:59:00 +0000', '2024-07-26 13:00:00 +0000']
+    >>> kolkata = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+    >>> strftime_many('%H:%M:%S.%f', [1721998740_250000000], unit='ns', tz=kolkata)
+    ['18:29:00.250000']
+    """
+    segments = _split_strftime(fmt)
+    if unit is not None:
+        epochs = cast(Iterable[int], values)
+        return _strftime_epochs(fmt, segments, epochs, _get_epoch_scale(unit), tz)
+    render = compile_strftime(fmt)
+    if segments is None:
+        return [render(value) for value in values]  # type: ignore[arg-type]
+    results = []
+    key = row = None
+    for value in values:
+        if not isinstance(value, datetime.datetime):
+            value = infer_datetime(value)  # type: ignore[arg-type]
+        hour = (value.hour, value.day, value.month, value.year, value.tzinfo)
+        if value.tzinfo is not None:
+            hour += (value.utcoffset(), value.tzname())
+        if hour != key:
+            key, row = hour, _strftime_row(segments, value)
+        micros = value.microsecond
+        fields = value.minute, value.second, micros, micros // 1000, micros % 1000
+        results.append(row(*fields))  # type: ignore[misc]
+    return results
+
+
+def _strftime_epochs(
+    fmt: str,
+    segments: list[tuple[bool, str]] | None,
+    values: Iterable[int],
+    scale: int,
+    tz: datetime.tzinfo,
+) -> list[str]:
+    """
+    Format epoch offsets (in units of ``1 / scale`` seconds) in tz,
+    rendering the hourly segments once per local hour for each
+    UTC hour in which the zone's offset is constant.
+    """
+    render = compile_strftime(fmt)
+    results = []
+    utc_hour = local_hour = None
+    offset = 0
+    uniform = False
+    row = None
+    for value in values:
+        seconds, fraction = divmod(value, scale)
+        micros = fraction * 10**6 // scale
+        hour = seconds // 3600
+        if hour != utc_hour:
+            utc_hour, local_hour = hour, None
+            start = _utc_epoch + datetime.timedelta(hours=hour)
+            first = start.astimezone(tz)
+            last = (start + datetime.timedelta(seconds=3599)).astimezone(tz)
+            zone = first.utcoffset(), first.tzname()
+            uniform = segments is not None and zone == (last.utcoffset(), last.tzname())
+            offset = int(zone[0].total_seconds()) if zone[0] else 0
+        if not uniform:
+            moment = _utc_epoch + datetime.timedelta(
+                seconds=seconds, microseconds=micros
+            )
+            results.append(render(moment.astimezone(tz)))
+            continue
+        local, within = divmod(seconds + offset, 3600)
+        if local != local_hour:
+            local_hour = local
+            moment = (_utc_epoch + datetime.timedelta(seconds=seconds)).astimezone(tz)
+            row = _strftime_row(segments, moment)  # type: ignore[arg-type]
+        minute, second = divmod(within, 60)
+        fields = minute, second, micros, micros // 1000, micros % 1000
+        results.append(row(*fields))  # type: ignore[misc]
+    return results
 
 
 def datetime_mod(
     dt: datetime.datetime,
-    period: datetime.timedelta,
+    period: datetime.timedelta | str,
     start: datetime.datetime | None = None,
 ) -> datetime.datetime:
     """
@@ -185,7 +455,15 @@ def datetime_mod(
     ...     datetime.timedelta(days = 7),
     ...     start = datetime.datetime(2004, 1, 1))
     datetime.datetime(2004, 1, 8, 0, 0)
+
+    The period may also be a calendar unit (see :func:`calendar_floor`).
+
+    >>> datetime_mod(datetime.datetime(2004, 2, 10, 13), 'month')
+    datetime.datetime(2004, 2, 1, 0, 0)
     """
+    if isinstance(period, str):
+        _check_calendar_start(start)
+        return calendar_floor(dt, period)
     if start is None:
         # use midnight of the same day
         start = datetime.datetime.combine(dt.date(), datetime.time())
@@ -193,22 +471,86 @@ def datetime_mod(
     delta = dt - start
 
     # now aggregate the delta and the period into microseconds
+    remainder = _timedelta_microseconds(delta) % _timedelta_microseconds(period)
+    offset = datetime.timedelta(microseconds=remainder)
+    # the result is the original specified time minus the offset
+    result = dt - offset
+    return result
+
+
+def _check_calendar_start(start: datetime.datetime | None) -> None:
+    if start is not None:
+        raise ValueError("start is not supported for calendar periods")
+
+
+def _timedelta_microseconds(td: datetime.timedelta) -> int:
     # Use microseconds because that's the highest precision of these time
     # pieces.  Also, using microseconds ensures perfect precision (no floating
     # point errors).
-    def get_time_delta_microseconds(td: datetime.timedelta) -> int:
-        return (td.days * seconds_per_day + td.seconds) * 1000000 + td.microseconds
+    return (td.days * seconds_per_day + td.seconds) * 1000000 + td.microseconds
 
-    delta, period = map(get_time_delta_microseconds, (delta, period))  # type: ignore[assignment]
-    offset = datetime.timedelta(microseconds=delta % period)  # type: ignore[arg-type]
-    # the result is the original specified time minus the offset
-    result = dt - offset
-    return result
+
+def _epoch_microseconds(dt: datetime.datetime) -> int:
+    """
+    Microseconds since the epoch, taking naive dt as UTC.
+
+    >>> _epoch_microseconds(datetime.datetime(1970, 1, 2, microsecond=1))
+    86400000001
+    """
+    epoch = _utc_epoch if dt.tzinfo else _utc_epoch.replace(tzinfo=None)
+    return _timedelta_microseconds(dt - epoch)
+
+
+def _period_remainders(
+    values: Iterable[int],
+    period: int,
+    start: datetime.datetime | int | None,
+) -> Iterator[tuple[int, int]]:
+    """
+    Pair each of values with its offset into the period relative to
+    start (by default, midnight of the same day).
+    """
+    if start is None:
+        day = seconds_per_day * 1_000_000
+        return ((value, value % day % period) for value in values)
+    if isinstance(start, datetime.datetime):
+        start = _epoch_microseconds(start)
+    return ((value, (value - start) % period) for value in values)
+
+
+def datetime_mod_many(
+    values: Iterable[int],
+    period: datetime.timedelta | int,
+    start: datetime.datetime | int | None = None,
+) -> array.array[int]:
+    """
+    Truncate each of values, in microseconds since the epoch, to the
+    period (a timedelta or microseconds) relative to start,
+    as :func:`datetime_mod` would for the corresponding (naive)
+    datetimes. By default, the start is midnight of the same day
+    as each value.
+
+    >>> stamps = [datetime.datetime(2004, 1, 2, 3), datetime.datetime(2004, 1, 2, 13)]
+    >>> values = map(_epoch_microseconds, stamps)
+    >>> period = datetime.timedelta(days=1.5)
+    >>> start = datetime.datetime(2004, 1, 1)
+    >>> result = datetime_mod_many(values, period, start)
+    >>> result
+    array('q', [1072915200000000, 1073044800000000])
+    >>> result.tolist() == [
+    ...     _epoch_microseconds(datetime_mod(stamp, period, start)) for stamp in stamps
+    ... ]
+    True
+    """
+    if isinstance(period, datetime.timedelta):
+        period = _timedelta_microseconds(period)
+    pairs = _period_remainders(values, period, start)
+    return array.array('q', [value - remainder for value, remainder in pairs])
 
 
 def datetime_round(
     dt: datetime.datetime,
-    period: datetime.timedelta,
+    period: datetime.timedelta | str,
     start: datetime.datetime | None = None,
 ) -> datetime.datetime:
     """
@@ -223,14 +565,264 @@ def datetime_round(
     >>> datetime_round(datetime.datetime(2004, 11, 13, 8, 30),
     ...     datetime.timedelta(hours = 1))
     datetime.datetime(2004, 11, 13, 9, 0)
+    >>> datetime_round(datetime.datetime(2004, 11, 13, 8, 30), 'year')
+    datetime.datetime(2005, 1, 1, 0, 0)
     """
+    if isinstance(period, str):
+        _check_calendar_start(start)
+        return calendar_round(dt, period)
     result = datetime_mod(dt, period, start)
     if abs(dt - result) >= period // 2:
         result += period
     return result
 
 
-def get_nearest_year_for_day(day: int) -> int:
+def datetime_round_many(
+    values: Iterable[int],
+    period: datetime.timedelta | int,
+    start: datetime.datetime | int | None = None,
+) -> array.array[int]:
+    """
+    Round each of values, in microseconds since the epoch, to the
+    nearest period, as :func:`datetime_round` would.
+
+    >>> hour = 3600 * 10**6
+    >>> datetime_round_many([8 * hour + 1, 8 * hour + hour // 2], hour)
+    array('q', [28800000000, 32400000000])
+    """
+    if isinstance(period, datetime.timedelta):
+        period = _timedelta_microseconds(period)
+    half = period // 2
+    pairs = _period_remainders(values, period, start)
+    return array.array(
+        'q',
+        [
+            value - remainder + (period if remainder >= half else 0)
+            for value, remainder in pairs
+        ],
+    )
+
+
+_calendar_months = dict(month=1, quarter=3, year=12)
+
+_calendar_days = dict(day=1, week=7)
+
+
+def _calendar_floor_date(date: datetime.date, unit: str) -> datetime.date:
+    """
+    The first day of the calendar unit containing date.
+
+    >>> _calendar_floor_date(datetime.date(2024, 8, 15), 'quarter')
+    datetime.date(2024, 7, 1)
+    >>> _calendar_floor_date(datetime.date(2024, 8, 15), 'week')
+    datetime.date(2024, 8, 12)
+    """
+    if unit == 'week':
+        return date - datetime.timedelta(days=date.weekday())
+    if unit in _calendar_days:
+        return date
+    try:
+        months = _calendar_months[unit]
+    except KeyError:
+        raise ValueError("period not in (day, week, month, quarter, year)")
+    month = (date.month - 1) // months * months + 1
+    return date.replace(month=month, day=1)
+
+
+def _calendar_next(date: datetime.date, unit: str) -> datetime.date:
+    """
+    The first day of the calendar unit following the one beginning
+    on date.
+    """
+    if unit in _calendar_days:
+        return date + datetime.timedelta(days=_calendar_days[unit])
+    years, month = divmod(date.month - 1 + _calendar_months[unit], 12)
+    return date.replace(year=date.year + years, month=month + 1)
+
+
+def calendar_floor(
+    dt: datetime.datetime, unit: str, tz: datetime.tzinfo | None = None
+) -> datetime.datetime:
+    """
+    Truncate dt to the start of its calendar day, week (ISO, starting
+    Monday), month, quarter or year, in tz (by default, dt's own zone).
+
+    >>> calendar_floor(datetime.datetime(2024, 8, 15, 13), 'quarter')
+    datetime.datetime(2024, 7, 1, 0, 0)
+    >>> utc = datetime.timezone.utc
+    >>> pacific = datetime.timezone(datetime.timedelta(hours=-8))
+    >>> calendar_floor(datetime.datetime(2024, 1, 1, 3, tzinfo=utc), 'year', pacific)
+    datetime.datetime(2023, 1, 1, 0, 0, tzinfo=...(days=-1, seconds=57600)))
+    """
+    if tz is not None:
+        dt = dt.astimezone(tz)
+    date = _calendar_floor_date(dt.date(), unit)
+    return datetime.datetime.combine(date, datetime.time(), dt.tzinfo)
+
+
+def calendar_round(
+    dt: datetime.datetime, unit: str, tz: datetime.tzinfo | None = None
+) -> datetime.datetime:
+    """
+    Find the calendar boundary nearest dt, as :func:`calendar_floor`
+    (halfway rounds up, as with :func:`datetime_round`).
+
+    >>> calendar_round(datetime.datetime(2024, 2, 15, 12), 'month')
+    datetime.datetime(2024, 3, 1, 0, 0)
+    >>> calendar_round(datetime.datetime(2024, 2, 15, 11, 59), 'month')
+    datetime.datetime(2024, 2, 1, 0, 0)
+    """
+    start = calendar_floor(dt, unit, tz)
+    end = datetime.datetime.combine(
+        _calendar_next(start.date(), unit), datetime.time(), start.tzinfo
+    )
+    elapsed = _epoch_microseconds(dt) - _epoch_microseconds(start)
+    length = _epoch_microseconds(end) - _epoch_microseconds(start)
+    return end if elapsed >= length // 2 else start
+
+
+class _DayStarts:
+    """
+    Epoch microseconds at which each local day (by ordinal) begins
+    in a zone, computed a year at a time.
+    """
+
+    def __init__(self, tz: datetime.tzinfo) -> None:
+        self.tz = tz
+        self.starts: dict[int, int] = {}
+
+    def __getitem__(self, ordinal: int) -> int:
+        try:
+            return self.starts[ordinal]
+        except KeyError:
+            pass
+        year = datetime.date.fromordinal(ordinal).year
+        first = datetime.date(year, 1, 1).toordinal()
+        last = datetime.date(year + 1, 1, 1).toordinal()
+        midnight = datetime.time(tzinfo=self.tz)
+        for day in range(first, last):
+            moment = datetime.datetime.combine(datetime.date.fromordinal(day), midnight)
+            self.starts[day] = _epoch_microseconds(moment)
+        return self.starts[ordinal]
+
+    def bounds(self, value: int, unit: str) -> tuple[int, int]:
+        """
+        The start and end, in epoch microseconds, of the calendar unit
+        containing value.
+        """
+        # the local date is within a day of the UTC date
+        ordinal = value // (seconds_per_day * 1_000_000) + _epoch_ordinal + 1
+        while self[ordinal] > value:
+            ordinal -= 1
+        start = _calendar_floor_date(datetime.date.fromordinal(ordinal), unit)
+        end = _calendar_next(start, unit)
+        return self[start.toordinal()], self[end.toordinal()]
+
+
+_epoch_ordinal = datetime.date(1970, 1, 1).toordinal()
+
+_day_starts: collections.OrderedDict[object, _DayStarts] = collections.OrderedDict()
+"""
+The most recently used day-start tables, by zone.
+"""
+
+
+def _zone_day_starts(tz: datetime.tzinfo, maxsize: int = 32) -> _DayStarts:
+    """
+    The day-start table for tz, shared by equal zones.
+
+    >>> one, other = (datetime.timezone(datetime.timedelta(hours=1)) for _ in 'ab')
+    >>> _zone_day_starts(one) is _zone_day_starts(other)
+    True
+    """
+    key: object = tz
+    try:
+        hash(tz)
+    except TypeError:
+        # dateutil zones are unhashable; key them by identity (the
+        # table retains its zone, so the id isn't reused while cached)
+        key = id(tz)
+    days = _day_starts.pop(key, None) or _DayStarts(tz)
+    _day_starts[key] = days
+    while len(_day_starts) > maxsize:
+        _day_starts.popitem(last=False)
+    return days
+
+
+def _calendar_bounds_many(
+    values: Iterable[int], unit: str, tz: datetime.tzinfo
+) -> Iterator[tuple[int, int, int]]:
+    """
+    Yield each of values with the bounds of its calendar unit in tz,
+    reusing the bounds while consecutive values share them.
+    """
+    if unit not in _calendar_days and unit not in _calendar_months:
+        raise ValueError("period not in (day, week, month, quarter, year)")
+    days = _zone_day_starts(tz)
+    start = end = 0
+    for value in values:
+        if not start <= value < end:
+            start, end = days.bounds(value, unit)
+        yield value, start, end
+
+
+def calendar_floor_many(
+    values: Iterable[int],
+    unit: str,
+    tz: datetime.tzinfo = datetime.timezone.utc,
+) -> array.array[int]:
+    """
+    Truncate each of values, in microseconds since the epoch, to the
+    start of its calendar unit in tz, as :func:`calendar_floor` would.
+
+    Local day starts are computed once per zone and year, so values
+    are bucketed without converting each to local time.
+
+    >>> import zoneinfo
+    >>> zone = zoneinfo.ZoneInfo('America/New_York')
+    >>> moments = [
+    ...     datetime.datetime(2024, 3, 31, 23, tzinfo=zone),
+    ...     datetime.datetime(2024, 4, 1, tzinfo=zone),
+    ... ]
+    >>> starts = calendar_floor_many(map(_epoch_microseconds, moments), 'month', zone)
+    >>> for start in starts:
+    ...     print(_utc_epoch + datetime.timedelta(microseconds=start))
+    2024-03-01 05:00:00+00:00
+    2024-04-01 04:00:00+00:00
+    """
+    bounds = _calendar_bounds_many(values, unit, tz)
+    return array.array('q', [start for _, start, _ in bounds])
+
+
+def calendar_round_many(
+    values: Iterable[int],
+    unit: str,
+    tz: datetime.tzinfo = datetime.timezone.utc,
+) -> array.array[int]:
+    """
+    Round each of values, in microseconds since the epoch, to the
+    nearest calendar boundary in tz, as :func:`calendar_round` would.
+
+    >>> noon = _epoch_microseconds(datetime.datetime(2024, 2, 15, 12))
+    >>> calendar_round_many([noon - 1, noon], 'month').tolist() == [
+    ...     _epoch_microseconds(datetime.datetime(2024, 2, 1)),
+    ...     _epoch_microseconds(datetime.datetime(2024, 3, 1)),
+    ... ]
+    True
+    """
+    bounds = _calendar_bounds_many(values, unit, tz)
+    return array.array(
+        'q',
+        [
+            end if value - start >= (end - start) // 2 else start
+            for value, start, end in bounds
+        ],
+    )
+
+
+def get_nearest_year_for_day(
+    day: int, now: datetime.date | time.struct_time | None = None
+) -> int:
     """
     Returns the nearest year to now inferred from a Julian date.
 
@@ -243,16 +835,46 @@ def get_nearest_year_for_day(day: int) -> int:
     >>> freezer.move_to('2019-12-15')
     >>> get_nearest_year_for_day(20)
     2020
+
+    Pass now to infer the year relative to another moment.
+
+    >>> get_nearest_year_for_day(20, now=datetime.date(2007, 12, 1))
+    2008
     """
-    now = time.gmtime()
-    result = now.tm_year
+    year, today = _reference_day(now)
     # if the day is far greater than today, it must be from last year
-    if day - now.tm_yday > 365 // 2:
-        result -= 1
+    if day - today > 365 // 2:
+        return year - 1
     # if the day is far less than today, it must be for next year.
-    if now.tm_yday - day > 365 // 2:
-        result += 1
-    return result
+    if today - day > 365 // 2:
+        return year + 1
+    return year
+
+
+def _reference_day(now: datetime.date | time.struct_time | None) -> tuple[int, int]:
+    """
+    The year and (1-based) day of the year of now, defaulting to the
+    current UTC time.
+    """
+    if now is None:
+        now = time.gmtime()
+    elif isinstance(now, datetime.date):
+        now = now.timetuple()
+    return now.tm_year, now.tm_yday
+
+
+class _YearStarts(dict[int, int]):
+    """
+    The proleptic ordinal of the day before January 1 of each year,
+    computed on first use.
+    """
+
+    def __missing__(self, year: int) -> int:
+        self[year] = start = datetime.date(year, 1, 1).toordinal() - 1
+        return start
+
+
+_year_starts = _YearStarts()
 
 
 def gregorian_date(year: int, julian_day: int) -> datetime.date:
@@ -262,10 +884,85 @@ def gregorian_date(year: int, julian_day: int) -> datetime.date:
 
     >>> gregorian_date(2007, 15)
     datetime.date(2007, 1, 15)
+    >>> gregorian_date(2007, 366)
+    datetime.date(2008, 1, 1)
     """
-    result = datetime.date(year, 1, 1)
-    result += datetime.timedelta(days=julian_day - 1)
-    return result
+    return datetime.date.fromordinal(_year_starts[year] + julian_day)
+
+
+def gregorian_ordinals(
+    julian_days: Iterable[int],
+    years: int | Iterable[int] | None = None,
+    now: datetime.date | time.struct_time | None = None,
+) -> array.array[int]:
+    """
+    Convert julian days (1-based days of the year) to proleptic
+    Gregorian ordinals, as an array of 64-bit ints, adding
+    precomputed year offsets rather than building a date per day.
+
+    Supply the year of each day, a single year for all of them,
+
+    >>> gregorian_ordinals([15, 60], 2024).tolist() == [
+    ...     datetime.date(2024, 1, 15).toordinal(),
+    ...     datetime.date(2024, 2, 29).toordinal(),
+    ... ]
+    True
+    >>> gregorian_dates(gregorian_ordinals([60, 60], [2023, 2024]))
+    [datetime.date(2023, 3, 1), datetime.date(2024, 2, 29)]
+    >>> gregorian_ordinals([60, 60], [2024])
+    Traceback (most recent call last):
+    ...
+    ValueError: zip() argument 2 is shorter than argument 1
+
+    or none, to infer the nearest year as in
+    :func:`get_nearest_year_for_day`, relative to now (evaluated once
+    for the batch).
+
+    >>> days = gregorian_ordinals([340, 20], now=datetime.date(2019, 5, 20))
+    >>> gregorian_dates(days)
+    [datetime.date(2018, 12, 6), datetime.date(2019, 1, 20)]
+    >>> days = gregorian_ordinals([1, 340], now=datetime.date(9999, 6, 1))
+    >>> gregorian_dates(days)
+    [datetime.date(9999, 1, 1), datetime.date(9998, 12, 6)]
+    """
+    if isinstance(years, int):
+        offset = _year_starts[years]
+        return array.array('q', [day + offset for day in julian_days])
+    if years is not None:
+        pairs = zip(julian_days, years, strict=True)
+        return array.array('q', [day + _year_starts[year] for day, year in pairs])
+    year, today = _reference_day(now)
+    current = _year_starts[year]
+    # derive the neighbouring years, which may lie beyond the range
+    # of date (needed by no day, unless inferred there anyway)
+    previous = current - 365 - calendar.isleap(year - 1)
+    following = current + 365 + calendar.isleap(year)
+    half = 365 // 2
+    return array.array(
+        'q',
+        [
+            day
+            + (
+                previous
+                if day - today > half
+                else following
+                if today - day > half
+                else current
+            )
+            for day in julian_days
+        ],
+    )
+
+
+def gregorian_dates(ordinals: Iterable[int]) -> list[datetime.date]:
+    """
+    The dates for proleptic Gregorian ordinals, such as those from
+    :func:`gregorian_ordinals`.
+
+    >>> gregorian_dates(gregorian_ordinals([1, 365], 2007))
+    [datetime.date(2007, 1, 1), datetime.date(2007, 12, 31)]
+    """
+    return list(map(datetime.date.fromordinal, ordinals))
 
 
 @functools.singledispatch
@@ -350,6 +1047,151 @@ def get_date_format_string(period: str | numbers.Number | datetime.timedelta) ->
     return ''.join(format_pieces)
 
 
+class TimeBuckets:
+    """
+    Streaming group-by-time: count (and optionally sum values for)
+    timestamps by period, for any period accepted by
+    :func:`get_period_seconds`.
+
+    Timestamps are datetimes (naive ones taken as UTC) or integer
+    microseconds since the epoch, and are mapped to integer bucket ids;
+    keys are formatted (with :func:`get_date_format_string`) only
+    on output.
+
+    >>> buckets = TimeBuckets('hour')
+    >>> buckets.add(datetime.datetime(2024, 7, 26, 12, 59), 3)
+    >>> buckets.update(
+    ...     [datetime.datetime(2024, 7, 26, 13), datetime.datetime(2024, 7, 26, 13, 30)],
+    ...     [4, 5],
+    ... )
+    >>> list(buckets.items())
+    [('2024-07-26 12', 1, 3), ('2024-07-26 13', 2, 9)]
+
+    Other periods are fixed widths counted from the epoch, so days
+    follow the UTC calendar; months and years follow it too.
+
+    >>> buckets = TimeBuckets('month')
+    >>> march = _epoch_microseconds(datetime.datetime(2024, 3, 31, 23))
+    >>> buckets.update([march, march + 3600 * 10**6])
+    >>> list(buckets.items())
+    [('2024-03', 1, 0), ('2024-04', 1, 0)]
+
+    Accumulators from separate workers may be merged.
+
+    >>> other = TimeBuckets('month')
+    >>> other.add(datetime.datetime(2024, 4, 15))
+    >>> buckets.merge(other)
+    >>> buckets.counts
+    Counter({24291: 2, 24290: 1})
+    >>> buckets.start(24291)
+    datetime.datetime(2024, 4, 1, 0, 0)
+    """
+
+    def __init__(self, period: str | numbers.Number | datetime.timedelta) -> None:
+        self.format = get_date_format_string(period)
+        name = period.lower() if isinstance(period, str) else None
+        self._months = {'month': 1, 'year': 12}.get(name, 0)  # type: ignore[arg-type]
+        self._width = 0
+        if not self._months:
+            seconds = get_period_seconds(period)
+            self._width = round(seconds * 1_000_000)  # type: ignore[operator]
+        self.counts: collections.Counter[int] = collections.Counter()
+        self.sums: collections.Counter[int] = collections.Counter()
+
+    def bucket(self, moment: datetime.datetime | int) -> int:
+        """
+        The bucket id for moment.
+        """
+        return next(self._buckets([moment]))
+
+    def _buckets(self, moments: Iterable[datetime.datetime | int]) -> Iterator[int]:
+        width = self._width
+        lower = upper = index = 0
+        for moment in moments:
+            if isinstance(moment, datetime.datetime):
+                moment = _epoch_microseconds(moment)
+            if width:
+                yield moment // width
+                continue
+            if not lower <= moment < upper:
+                # find the month containing moment (and its bounds)
+                days = moment // (seconds_per_day * 1_000_000)
+                date = datetime.date.fromordinal(days + _epoch_ordinal).replace(day=1)
+                index = date.year * 12 + date.month - 1
+                lower = _epoch_microseconds(
+                    datetime.datetime.combine(date, datetime.time())
+                )
+                following = _calendar_next(date, 'month')
+                upper = _epoch_microseconds(
+                    datetime.datetime.combine(following, datetime.time())
+                )
+            yield index // self._months
+
+    def start(self, bucket: int) -> datetime.datetime:
+        """
+        The (naive UTC) start of bucket.
+        """
+        if self._width:
+            return _utc_epoch.replace(tzinfo=None) + datetime.timedelta(
+                microseconds=bucket * self._width
+            )
+        year, month = divmod(bucket * self._months, 12)
+        return datetime.datetime(year, month + 1, 1)
+
+    def add(self, moment: datetime.datetime | int, value: float | None = None) -> None:
+        bucket = self.bucket(moment)
+        self.counts[bucket] += 1
+        if value is not None:
+            self.sums[bucket] += value  # type: ignore[assignment]
+
+    def update(
+        self,
+        moments: Iterable[datetime.datetime | int],
+        values: Iterable[float] | None = None,
+    ) -> None:
+        """
+        Count each of moments, summing the corresponding values if given.
+
+        Values must correspond one to one with moments; if not, none
+        are counted.
+
+        >>> buckets = TimeBuckets('minute')
+        >>> buckets.update([0, 1, 2], [5])
+        Traceback (most recent call last):
+        ...
+        ValueError: zip() argument 2 is shorter than argument 1
+        >>> buckets.counts
+        Counter()
+        """
+        buckets = self._buckets(moments)
+        if values is None:
+            self.counts.update(collections.Counter(buckets))
+            return
+        counts: collections.Counter[int] = collections.Counter()
+        sums: collections.Counter[int] = collections.Counter()
+        for bucket, value in zip(buckets, values, strict=True):
+            counts[bucket] += 1
+            sums[bucket] += value  # type: ignore[assignment]
+        self.counts.update(counts)
+        self.sums.update(sums)
+
+    def merge(self, other: TimeBuckets) -> None:
+        if (self._width, self._months) != (other._width, other._months):
+            raise ValueError("Cannot merge buckets of different periods")
+        self.counts.update(other.counts)
+        self.sums.update(other.sums)
+
+    def items(self) -> Iterator[tuple[str, int, float]]:
+        """
+        Yield the formatted key, count and sum for each bucket, in order.
+        """
+        buckets = sorted(self.counts)
+        starts = array.array('q', [_epoch_microseconds(self.start(b)) for b in buckets])
+        keys = strftime_many(self.format, starts, unit='us')
+        for key, bucket in zip(keys, buckets):
+            yield key, self.counts[bucket], self.sums[bucket]
+
+
 def calculate_prorated_values() -> None:
     """
     >>> monkeypatch = getfixture('monkeypatch')
@@ -521,6 +1363,212 @@ def parse_nanoseconds(str: str) -> decimal.Decimal:
     return _parse_timedelta_nanos(str).total_nanoseconds
 
 
+def _parse_column(
+    strings: Iterable[str], parse: Callable[[str], _T]
+) -> Iterator[_T | ValueError]:
+    """
+    Parse each of strings, parsing each distinct string only once
+    and yielding the ValueError for those that fail (including those
+    out of range).
+    """
+    seen: dict[str, _T | ValueError] = {}
+    for text in strings:
+        try:
+            yield seen[text]
+        except KeyError:
+            try:
+                result: _T | ValueError = parse(text)
+            except ValueError as exc:
+                result = exc
+            except OverflowError as exc:
+                result = ValueError(f"Out of range: {text!r}")
+                result.__cause__ = exc
+            yield seen.setdefault(text, result)
+
+
+def parse_timedeltas(
+    strings: Iterable[str],
+) -> tuple[list[datetime.timedelta | None], dict[int, ValueError]]:
+    """
+    Parse a column of durations (see :func:`parse_timedelta`).
+
+    Return the timedeltas, with None for rows that could not be parsed,
+    and the errors for those rows by index.
+
+    >>> deltas, errors = parse_timedeltas(['1s', '5 min', 'foo', '1s'])
+    >>> deltas
+    [datetime.timedelta(seconds=1), datetime.timedelta(seconds=300), None, ...]
+    >>> errors
+    {2: ValueError("Unexpected 'foo'")}
+
+    Values beyond the range of timedelta are errors too.
+
+    >>> deltas, errors = parse_timedeltas(['1s', '1000000000 days'])
+    >>> deltas
+    [datetime.timedelta(seconds=1), None]
+    >>> errors
+    {1: ValueError("Out of range: '1000000000 days'")}
+    """
+    deltas: list[datetime.timedelta | None] = []
+    errors: dict[int, ValueError] = {}
+    for index, result in enumerate(_parse_column(strings, parse_timedelta)):
+        if isinstance(result, ValueError):
+            errors[index] = result
+            result = None  # type: ignore[assignment]
+        deltas.append(result)
+    return deltas, errors
+
+
+def parse_nanoseconds_many(
+    strings: Iterable[str], fill: int = 0
+) -> tuple[array.array[int], dict[int, ValueError]]:
+    """
+    Parse a column of durations (see :func:`parse_nanoseconds`)
+    into a compact array of signed 64-bit integer nanoseconds,
+    rounding any fractional nanoseconds.
+
+    Return the array, with ``fill`` for rows that could not be parsed,
+    and the errors for those rows by index.
+
+    >>> nanos, errors = parse_nanoseconds_many(['34.2 ns', '1 µs', '13 feet'])
+    >>> nanos
+    array('q', [34, 1000, 0])
+    >>> errors
+    {2: ValueError('Invalid unit feets')}
+
+    Durations beyond the range of the array are errors too.
+
+    >>> parse_nanoseconds_many(['1s', '300 years'])
+    (array('q', [1000000000, 0]), {1: ValueError('Duration out of range: 300 years')})
+    """
+    nanos = array.array('q')
+    errors: dict[int, ValueError] = {}
+
+    def parse(text: str) -> int:
+        result = round(parse_nanoseconds(text))
+        if not -(2**63) <= result < 2**63:
+            raise ValueError(f"Duration out of range: {text}")
+        return result
+
+    for index, result in enumerate(_parse_column(strings, parse)):
+        if isinstance(result, ValueError):
+            errors[index] = result
+            result = fill
+        nanos.append(result)
+    return nanos, errors
+
+
+_iso_duration = re.compile(
+    r'(?P<sign>[-+])?P(?!$)'
+    r'(?:(?P<years>\d+(?:[.,]\d+)?)Y)?'
+    r'(?:(?P<months>\d+(?:[.,]\d+)?)M)?'
+    r'(?:(?P<weeks>\d+(?:[.,]\d+)?)W)?'
+    r'(?:(?P<days>\d+(?:[.,]\d+)?)D)?'
+    r'(?:T(?=\d)'
+    r'(?:(?P<hours>\d+(?:[.,]\d+)?)H)?'
+    r'(?:(?P<minutes>\d+(?:[.,]\d+)?)M)?'
+    r'(?:(?P<seconds>\d+(?:[.,]\d+)?)S)?'
+    r')?',
+    re.ASCII,
+)
+
+# As in parse_timedelta, months and years are strict intervals
+# (a twelfth of and one ``seconds_per_year``), not calendar-aligned.
+_iso_nanoseconds = dict(
+    years=seconds_per_year * 10**9,
+    months=seconds_per_year // 12 * 10**9,
+    weeks=7 * seconds_per_day * 10**9,
+    days=seconds_per_day * 10**9,
+    hours=seconds_per_hour * 10**9,
+    minutes=seconds_per_minute * 10**9,
+    seconds=10**9,
+)
+
+
+def _parse_iso_nanos(text: str) -> int | decimal.Decimal:
+    match = _iso_duration.fullmatch(text)
+    if not match:
+        raise ValueError(f"Invalid ISO 8601 duration {text!r}")
+    total: int | decimal.Decimal = 0
+    for unit, factor in _iso_nanoseconds.items():
+        value = match.group(unit)
+        if value is None:
+            continue
+        if value.isdigit():
+            total += int(value) * factor
+        else:
+            total += decimal.Decimal(value.replace(',', '.')) * factor
+    return -total if match.group('sign') == '-' else total
+
+
+def parse_iso_duration(text: str) -> datetime.timedelta:
+    """
+    Parse an ISO 8601 duration (``PnYnMnDTnHnMnS`` or ``PnW``).
+
+    >>> parse_iso_duration('P1DT2H3M4.5S')
+    datetime.timedelta(days=1, seconds=7384, microseconds=500000)
+    >>> parse_iso_duration('PT0,25S')
+    datetime.timedelta(microseconds=250000)
+    >>> parse_iso_duration('-P2W')
+    datetime.timedelta(days=-14)
+
+    Months and years follow the same convention as
+    :func:`parse_timedelta`.
+
+    >>> parse_iso_duration('P1Y1M') == parse_timedelta('1 year, 1 month')
+    True
+
+    >>> parse_iso_duration('P1H')
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid ISO 8601 duration 'P1H'
+    >>> parse_iso_duration('PT')
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid ISO 8601 duration 'PT'
+    """
+    nanos = _parse_iso_nanos(text)
+    if isinstance(nanos, int):
+        micros = _round_div(nanos, 1000)
+    else:
+        micros = round(nanos / 1000)
+    return datetime.timedelta(microseconds=micros)
+
+
+def format_iso_duration(value: datetime.timedelta | Duration) -> str:
+    """
+    Render a timedelta or Duration as an ISO 8601 duration.
+
+    Only days and smaller units are used, so the result is exact.
+
+    >>> format_iso_duration(datetime.timedelta(days=1, seconds=7384.5))
+    'P1DT2H3M4.5S'
+    >>> format_iso_duration(datetime.timedelta(weeks=-2))
+    '-P14D'
+    >>> format_iso_duration(datetime.timedelta())
+    'PT0S'
+    >>> format_iso_duration(Duration(34.2))
+    'PT0.0000000342S'
+    """
+    nanos = _as_nanoseconds(value)
+    sign = '-' if nanos < 0 else ''
+    days, rest = divmod(abs(nanos), seconds_per_day * 10**9)
+    hours, rest = divmod(rest, seconds_per_hour * 10**9)
+    minutes, rest = divmod(rest, seconds_per_minute * 10**9)
+    seconds = format(decimal.Decimal(rest).scaleb(-9), 'f')
+    if '.' in seconds:
+        seconds = seconds.rstrip('0').rstrip('.')
+    date = f'{days}D' if days else ''
+    time = ''.join(
+        f'{amount}{unit}'
+        for amount, unit in ((hours, 'H'), (minutes, 'M'), (seconds, 'S'))
+        if amount and amount != '0'
+    )
+    if not date and not time:
+        time = '0S'
+    return f'{sign}P{date}' + (f'T{time}' if time else '')
+
+
 @functools.total_ordering
 class Duration:
     """
@@ -536,9 +1584,12 @@ class Duration:
     >>> Duration(34.2)
     Duration(Decimal('34.2'))
     >>> Duration(microseconds=1.6)
-    Duration(Decimal('1600.0'))
+    Duration(1600)
     >>> Duration(seconds=1, nanoseconds=5)
-    Duration(Decimal('1000000005'))
+    Duration(1000000005)
+
+    Whole nanoseconds are held as an int; any fraction of a
+    nanosecond is retained exactly.
 
     Or parse a textual duration (see :func:`parse_nanoseconds`):
 
@@ -584,7 +1635,7 @@ class Duration:
     microsecond resolution):
 
     >>> Duration.from_timedelta(datetime.timedelta(seconds=1))
-    Duration(Decimal('1000000000'))
+    Duration(1000000000)
     >>> Duration(microseconds=1.6).timedelta()
     datetime.timedelta(microseconds=2)
     """
@@ -603,7 +1654,18 @@ class Duration:
         decimal.Decimal(10**9): (decimal.Decimal(10**9), 'sec'),
     })
 
-    def __init__(self, nanoseconds: float | decimal.Decimal = 0, **units: float):
+    # Whole nanoseconds (truncated) and the remaining fraction of a
+    # nanosecond (of the same sign), which is the int 0 unless the
+    # duration has sub-nanosecond precision, so that typical arithmetic,
+    # comparison and hashing are int operations.
+    __slots__ = ('_frac', '_whole')
+    _whole: int
+    _frac: decimal.Decimal | int
+
+    def __init__(self, nanoseconds: int | float | decimal.Decimal = 0, **units: float):
+        if isinstance(nanoseconds, int) and not units:
+            self._whole, self._frac = nanoseconds, 0
+            return
         total = decimal.Decimal(str(nanoseconds))
         for unit, value in units.items():
             try:
@@ -611,22 +1673,68 @@ class Duration:
             except KeyError:
                 raise ValueError(f"Invalid unit {unit!r}")
             total += decimal.Decimal(str(value)) * factor
-        self.nanoseconds = total
+        self._whole = int(total)
+        self._frac = total - self._whole or 0
+
+    @staticmethod
+    def _make(whole: int, frac: decimal.Decimal | int = 0) -> Duration:
+        """
+        Construct from whole nanoseconds and a fraction in (-2, 2),
+        carrying as needed.
+        """
+        if frac:
+            carry = int(frac)
+            whole += carry
+            frac -= carry
+            if whole > 0 and frac < 0:
+                whole, frac = whole - 1, frac + 1
+            elif whole < 0 and frac > 0:
+                whole, frac = whole + 1, frac - 1
+            frac = frac or 0
+        result = object.__new__(Duration)
+        result._whole, result._frac = whole, frac
+        return result
+
+    @property
+    def nanoseconds(self) -> int | decimal.Decimal:
+        """
+        The exact number of nanoseconds, an int unless fractional.
+        """
+        if self._frac:
+            return self._whole + self._frac
+        return self._whole
 
     @classmethod
     def parse(cls, spec: str) -> Duration:
         return cls(parse_nanoseconds(spec))
 
+    @classmethod
+    def parse_iso(cls, spec: str) -> Duration:
+        """
+        Parse an ISO 8601 duration (see :func:`parse_iso_duration`).
+
+        >>> Duration.parse_iso('PT1.5S')
+        Duration(1500000000)
+        >>> print(Duration.parse_iso('PT0.0000000342S'))
+        34.2 nsec
+        >>> Duration.parse_iso('PT1M').isoformat()
+        'PT1M'
+        """
+        return cls(_parse_iso_nanos(spec))
+
+    def isoformat(self) -> str:
+        return format_iso_duration(self)
+
     @classmethod
     def from_timedelta(cls, delta: datetime.timedelta) -> Duration:
-        return cls(microseconds=delta // datetime.timedelta(microseconds=1))
+        return cls(delta // datetime.timedelta(microseconds=1) * 1000)
 
     def timedelta(self) -> datetime.timedelta:
-        micros = round(self.nanoseconds / self._ns_per['microseconds'])
+        micros = round(decimal.Decimal(self.nanoseconds) / 1000)
         return datetime.timedelta(microseconds=micros)
 
     def total_seconds(self) -> decimal.Decimal:
-        return self.nanoseconds / self._ns_per['seconds']
+        return decimal.Decimal(self.nanoseconds) / self._ns_per['seconds']
 
     def __str__(self) -> str:
         factor, unit = self._scale[abs(self.nanoseconds)]
@@ -638,83 +1746,537 @@ class Duration:
     def __add__(self, other: Duration) -> Duration:
         if not isinstance(other, Duration):
             return NotImplemented
-        return Duration(self.nanoseconds + other.nanoseconds)
+        return self._make(self._whole + other._whole, self._frac + other._frac)
 
     def __sub__(self, other: Duration) -> Duration:
         if not isinstance(other, Duration):
             return NotImplemented
-        return Duration(self.nanoseconds - other.nanoseconds)
+        return self._make(self._whole - other._whole, self._frac - other._frac)
 
     def __mul__(self, other: float) -> Duration:
+        if isinstance(other, int) and not self._frac:
+            return self._make(self._whole * other)
         if not isinstance(other, numbers.Real):
             return NotImplemented
-        return Duration(self.nanoseconds * decimal.Decimal(str(other)))
+        return Duration(decimal.Decimal(self.nanoseconds) * decimal.Decimal(str(other)))
 
     __rmul__ = __mul__
 
     def __truediv__(self, other: Duration | float) -> Duration | decimal.Decimal:
         if isinstance(other, Duration):
-            return self.nanoseconds / other.nanoseconds
+            return decimal.Decimal(self.nanoseconds) / other.nanoseconds
         if isinstance(other, numbers.Real):
-            return Duration(self.nanoseconds / decimal.Decimal(str(other)))
+            divided = decimal.Decimal(self.nanoseconds) / decimal.Decimal(str(other))
+            return Duration(divided)
         return NotImplemented
 
     def __neg__(self) -> Duration:
-        return Duration(-self.nanoseconds)
+        return self._make(-self._whole, -self._frac)
 
     def __abs__(self) -> Duration:
-        return Duration(abs(self.nanoseconds))
+        return -self if (self._whole or self._frac) < 0 else self
 
     def __bool__(self) -> bool:
-        return bool(self.nanoseconds)
+        return bool(self._whole or self._frac)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Duration):
             return NotImplemented
-        return self.nanoseconds == other.nanoseconds
+        return self._whole == other._whole and self._frac == other._frac
 
     def __lt__(self, other: Duration) -> bool:
         if not isinstance(other, Duration):
             return NotImplemented
-        return self.nanoseconds < other.nanoseconds
+        if self._whole != other._whole:
+            return self._whole < other._whole
+        return self._frac < other._frac
 
     def __hash__(self) -> int:
-        return hash(self.nanoseconds)
+        return hash(self._whole)
 
 
-def _parse_timedelta_nanos(str: str) -> _Saved_NS:
-    parts = re.finditer(r'(?P<value>[\d.:]+)\s?(?P<unit>[^\W\d_]+)?', str)
-    chk_parts = _check_unmatched(parts, str)
-    deltas = map(_parse_timedelta_part, chk_parts)
-    return sum(deltas, _Saved_NS())
+def _round_div(numerator: int, denominator: int) -> int:
+    """
+    Divide integers, rounding half to even like :func:`round`.
+
+    >>> _round_div(1500, 1000), _round_div(2500, 1000), _round_div(-1501, 1000)
+    (2, 2, -2)
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    twice = remainder * 2
+    if twice > denominator or twice == denominator and quotient % 2:
+        quotient += 1
+    return quotient
 
 
-def _check_unmatched(
-    matches: Iterable[re.Match[str]], text: str
-) -> Iterator[re.Match[str]]:
+class DurationArray(Sequence[Duration]):
     """
-    Ensure no words appear in unmatched text.
+    A compact sequence of durations stored as whole nanoseconds in a
+    contiguous buffer of signed 64-bit integers.
+
+    Where a list of :class:`Duration` costs an object per element,
+    a DurationArray costs eight bytes.
+
+    >>> durations = DurationArray([1500, 250, 1_000_000])
+    >>> durations
+    DurationArray([1500, 250, 1000000])
+    >>> durations[0]
+    Duration(1500)
+    >>> print(durations.sum(), durations.min(), durations.max(), sep=', ')
+    1 msec, 250 nsec, 1 msec
+    >>> print(durations.mean())
+    334 µsec
+
+    Arithmetic applies to each element, either pairwise with
+    another DurationArray or with a single Duration or scalar.
+
+    >>> durations + Duration(microseconds=1)
+    DurationArray([2500, 1250, 1001000])
+    >>> durations - durations
+    DurationArray([0, 0, 0])
+    >>> durations * 2
+    DurationArray([3000, 500, 2000000])
+    >>> Duration(microseconds=2) - durations
+    DurationArray([500, 1750, -998000])
+
+    Scaling is exact, rounding each product half to even.
+
+    >>> DurationArray([10**18 + 1, 5, 15]) * 1.0
+    DurationArray([1000000000000000001, 5, 15])
+    >>> DurationArray([5, 15]) * 0.1
+    DurationArray([0, 2])
+
+    Slices are views on the same buffer, not copies.
+
+    >>> tail = durations[1:]
+    >>> tail.sort()
+    >>> durations
+    DurationArray([1500, 250, 1000000])
+    >>> durations.sort(reverse=True)
+    >>> tail
+    DurationArray([1500, 250])
+
+    Percentiles interpolate linearly between the nearest ranks.
+
+    >>> DurationArray(range(0, 101)).percentile(95)
+    Duration(95)
+    >>> DurationArray([10, 20]).percentile(25)
+    Duration(Decimal('12.5'))
+
+    Neither is defined for no durations.
+
+    >>> DurationArray().mean()
+    Traceback (most recent call last):
+    ...
+    ValueError: DurationArray is empty
+    >>> DurationArray().percentile(50)
+    Traceback (most recent call last):
+    ...
+    ValueError: DurationArray is empty
+
+    Convert to and from timedeltas and Durations (rounding to their
+    respective resolutions).
+
+    >>> DurationArray.from_timedeltas([datetime.timedelta(seconds=1)])
+    DurationArray([1000000000])
+    >>> DurationArray([1500, 2500]).timedeltas()
+    [datetime.timedelta(microseconds=2), datetime.timedelta(microseconds=2)]
+    >>> DurationArray.from_durations([Duration(34.5), Duration(seconds=1)])
+    DurationArray([34, 1000000000])
+
+    The underlying buffer is exposed as :attr:`nanoseconds` for
+    interchange with other libraries.
+
+    >>> durations.nanoseconds.tolist()
+    [1000000, 1500, 250]
     """
 
-    def check_unmatched(unmatched: str) -> None:
-        found = re.search(r'\w+', unmatched)
-        if found:
-            raise ValueError(f"Unexpected {found.group(0)!r}")
+    def __init__(self, nanoseconds: Iterable[int] = ()) -> None:
+        try:
+            view = memoryview(nanoseconds)  # type: ignore[arg-type]
+        except TypeError:
+            view = memoryview(array.array('q', nanoseconds))
+        if view.format != 'q':
+            view = memoryview(array.array('q', view.tolist()))
+        self.nanoseconds = view
 
-    pos = 0
-    for match in matches:
-        check_unmatched(text[pos : match.start()])
-        yield match
-        pos = match.end()
-    check_unmatched(text[pos:])
+    @classmethod
+    def from_timedeltas(cls, deltas: Iterable[datetime.timedelta]) -> DurationArray:
+        micro = datetime.timedelta(microseconds=1)
+        return cls(delta // micro * 1000 for delta in deltas)
 
+    @classmethod
+    def from_durations(cls, durations: Iterable[Duration]) -> DurationArray:
+        return cls(round(duration.nanoseconds) for duration in durations)
 
-_unit_lookup = {
-    'µs': 'microsecond',
-    'µsec': 'microsecond',
-    'us': 'microsecond',
-    'usec': 'microsecond',
-    'micros': 'microsecond',
+    def timedeltas(self) -> list[datetime.timedelta]:
+        return [
+            datetime.timedelta(microseconds=_round_div(nanos, 1000))
+            for nanos in self.nanoseconds
+        ]
+
+    def __len__(self) -> int:
+        return len(self.nanoseconds)
+
+    @overload
+    def __getitem__(self, index: int) -> Duration: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> DurationArray: ...
+
+    def __getitem__(self, index: int | slice) -> Duration | DurationArray:
+        if isinstance(index, slice):
+            return DurationArray(self.nanoseconds[index])
+        return Duration(self.nanoseconds[index])
+
+    def __iter__(self) -> Iterator[Duration]:
+        return map(Duration, self.nanoseconds)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.nanoseconds.tolist()})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DurationArray):
+            return NotImplemented
+        return self.nanoseconds == other.nanoseconds
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _operand(self, other: DurationArray | Duration) -> Iterable[int]:
+        """
+        Resolve other to nanoseconds to pair with each element.
+        """
+        if isinstance(other, DurationArray):
+            if len(other) != len(self):
+                raise ValueError("DurationArrays differ in length")
+            return other.nanoseconds
+        return itertools.repeat(round(other.nanoseconds))
+
+    def __add__(self, other: DurationArray | Duration) -> DurationArray:
+        if not isinstance(other, (DurationArray, Duration)):
+            return NotImplemented
+        return DurationArray(map(operator.add, self.nanoseconds, self._operand(other)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: DurationArray | Duration) -> DurationArray:
+        if not isinstance(other, (DurationArray, Duration)):
+            return NotImplemented
+        return DurationArray(map(operator.sub, self.nanoseconds, self._operand(other)))
+
+    def __rsub__(self, other: Duration) -> DurationArray:
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return DurationArray(map(operator.sub, self._operand(other), self.nanoseconds))
+
+    def __mul__(self, other: float) -> DurationArray:
+        if isinstance(other, int):
+            return DurationArray(nanos * other for nanos in self.nanoseconds)
+        if not isinstance(other, numbers.Real):
+            return NotImplemented
+        factor = fractions.Fraction(str(other))
+        return DurationArray(round(nanos * factor) for nanos in self.nanoseconds)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> DurationArray:
+        return DurationArray(map(operator.neg, self.nanoseconds))
+
+    def sum(self) -> Duration:
+        return Duration(sum(self.nanoseconds))
+
+    def min(self) -> Duration:
+        return Duration(min(self.nanoseconds))
+
+    def max(self) -> Duration:
+        return Duration(max(self.nanoseconds))
+
+    def _check_empty(self) -> None:
+        if not self:
+            raise ValueError("DurationArray is empty")
+
+    def mean(self) -> Duration:
+        self._check_empty()
+        return Duration(decimal.Decimal(sum(self.nanoseconds)) / len(self))
+
+    def percentile(self, q: float) -> Duration:
+        """
+        Return the ``q``-th percentile (0 to 100).
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        self._check_empty()
+        ordered = sorted(self.nanoseconds)
+        rank = fractions.Fraction(q) * (len(ordered) - 1) / 100
+        lower = math.floor(rank)
+        value = ordered[lower]
+        if rank > lower:
+            value += (ordered[lower + 1] - value) * (rank - lower)
+        return Duration(decimal.Decimal(value.numerator) / value.denominator)
+
+    def sort(self, reverse: bool = False) -> None:
+        """
+        Sort the durations in place (affecting any other views).
+        """
+        self.nanoseconds[:] = array.array(
+            'q', sorted(self.nanoseconds, reverse=reverse)
+        )
+
+
+@functools.singledispatch
+def _as_nanoseconds(
+    value: Duration | datetime.timedelta | str,
+) -> int | decimal.Decimal:
+    raise TypeError('value must be a Duration, timedelta, or string')
+
+
+@_as_nanoseconds.register
+def _(value: Duration) -> int | decimal.Decimal:
+    return value.nanoseconds
+
+
+@_as_nanoseconds.register
+def _(value: datetime.timedelta) -> int | decimal.Decimal:
+    return value // datetime.timedelta(microseconds=1) * 1000
+
+
+@_as_nanoseconds.register
+def _(value: str) -> int | decimal.Decimal:
+    return parse_nanoseconds(value)
+
+
+class _LogSketch:
+    """
+    A mergeable quantile sketch with bounded relative error.
+
+    Values are counted in buckets whose bounds grow geometrically, so
+    the number of buckets depends only on the range of the values and
+    the accuracy, not on how many values are added.
+
+    >>> sketch = _LogSketch(accuracy=0.01)
+    >>> for value in range(1, 1001):
+    ...     sketch.add(value)
+    >>> 0.99 < sketch.quantile(0.5) / 500 < 1.01
+    True
+    """
+
+    def __init__(self, accuracy: float) -> None:
+        if not 0 < accuracy < 1:
+            raise ValueError("accuracy must be between 0 and 1")
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: collections.Counter[int] = collections.Counter()
+        self.negative: collections.Counter[int] = collections.Counter()
+        self.zero = 0
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma**key / (self.gamma + 1)
+
+    def add(self, value: float) -> None:
+        if value > 0:
+            self.positive[self._key(value)] += 1
+        elif value < 0:
+            self.negative[self._key(-value)] += 1
+        else:
+            self.zero += 1
+
+    def merge(self, other: _LogSketch) -> None:
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches of differing accuracy")
+        self.positive.update(other.positive)
+        self.negative.update(other.negative)
+        self.zero += other.zero
+
+    def _buckets(self) -> Iterator[tuple[float, int]]:
+        """
+        Generate the representative value and count of each bucket
+        in ascending order of value.
+        """
+        for key in sorted(self.negative, reverse=True):
+            yield -self._value(key), self.negative[key]
+        yield 0, self.zero
+        for key in sorted(self.positive):
+            yield self._value(key), self.positive[key]
+
+    def quantile(self, q: float) -> float:
+        rank = q * (self.zero + self.positive.total() + self.negative.total() - 1)
+        seen = 0
+        for value, count in self._buckets():
+            seen += count
+            if seen > rank:
+                return value
+        raise ValueError("No values in sketch")
+
+
+class DurationStats:
+    """
+    Accumulate statistics over a stream of durations, in constant memory.
+
+    Accepts :class:`Duration`, :class:`datetime.timedelta`, or
+    strings (see :func:`parse_nanoseconds`).
+
+    >>> stats = DurationStats()
+    >>> stats.add('1 ms')
+    >>> stats.update([datetime.timedelta(milliseconds=2), Duration(seconds=0.003)])
+    >>> stats.count
+    3
+    >>> print(stats.sum(), stats.min(), stats.max(), stats.mean(), sep=', ')
+    6 msec, 1 msec, 3 msec, 2 msec
+    >>> print(stats.stdev())
+    1 msec
+
+    Quantiles are estimated from a sketch, with a relative error
+    bounded by ``accuracy``.
+
+    >>> stats = DurationStats(accuracy=0.01)
+    >>> stats.update(Duration(microseconds=n) for n in range(1, 10_001))
+    >>> p99 = stats.quantile(0.99)
+    >>> abs(p99 / Duration(microseconds=9900) - 1) < 0.01
+    True
+    >>> DurationStats(accuracy=1)
+    Traceback (most recent call last):
+    ...
+    ValueError: accuracy must be between 0 and 1
+
+    Accumulators from separate workers may be merged (they pickle
+    readily for transport between processes).
+
+    >>> other = DurationStats(accuracy=0.01)
+    >>> other.add('20 ms')
+    >>> stats.merge(other)
+    >>> stats.count
+    10001
+    >>> print(stats.max())
+    20 msec
+    """
+
+    def __init__(self, accuracy: float = 0.01) -> None:
+        self.count = 0
+        self._total: int | decimal.Decimal = 0
+        self._min: int | decimal.Decimal | None = None
+        self._max: int | decimal.Decimal | None = None
+        # running mean and sum of squared deviations (Welford)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sketch = _LogSketch(accuracy)
+
+    def add(self, value: Duration | datetime.timedelta | str) -> None:
+        nanos = _as_nanoseconds(value)
+        self.count += 1
+        self._total += nanos
+        if self._min is None or nanos < self._min:
+            self._min = nanos
+        if self._max is None or nanos > self._max:
+            self._max = nanos
+        delta = float(nanos) - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (float(nanos) - self._mean)
+        self._sketch.add(float(nanos))
+
+    def update(self, values: Iterable[Duration | datetime.timedelta | str]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: DurationStats) -> None:
+        """
+        Incorporate the values accumulated by other.
+        """
+        if not other.count:
+            return
+        self._sketch.merge(other._sketch)
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self._total += other._total
+        if self._min is None or other._min < self._min:  # type: ignore[operator]
+            self._min = other._min
+        if self._max is None or other._max > self._max:  # type: ignore[operator]
+            self._max = other._max
+
+    def _require(self, count: int) -> None:
+        if self.count < count:
+            raise ValueError(f"At least {count} value(s) required")
+
+    def sum(self) -> Duration:
+        return Duration(self._total)
+
+    def min(self) -> Duration:
+        self._require(1)
+        return Duration(self._min)  # type: ignore[arg-type]
+
+    def max(self) -> Duration:
+        self._require(1)
+        return Duration(self._max)  # type: ignore[arg-type]
+
+    def mean(self) -> Duration:
+        self._require(1)
+        return Duration(decimal.Decimal(self._total) / self.count)
+
+    def variance(self) -> float:
+        """
+        The sample variance, in square nanoseconds.
+        """
+        self._require(2)
+        return self._m2 / (self.count - 1)
+
+    def stdev(self) -> Duration:
+        """
+        The sample standard deviation.
+        """
+        return Duration(round(math.sqrt(self.variance())))
+
+    def quantile(self, q: float) -> Duration:
+        """
+        Estimate the ``q``-th quantile (0 to 1).
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self._require(1)
+        if q in (0, 1):
+            return self.max() if q else self.min()
+        estimate = decimal.Decimal(self._sketch.quantile(q))
+        bounded = min(max(estimate, self._min), self._max)  # type: ignore[type-var]
+        return Duration(round(bounded))
+
+
+_timedelta_token = re.compile(
+    r'(?P<value>[\d.:]+)\s?(?P<unit>[^\W\d_]+)?|(?P<unexpected>[^\W\d]+)'
+)
+"""
+Match each number with its optional unit, or any word appearing
+outside of one (which is an error).
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timedelta_nanos(str: str) -> _Saved_NS:
+    """
+    Parse the text in a single pass over its tokens.
+
+    Values are memoized, so repeatedly parsing common inputs
+    (e.g. from configuration) is cheap.
+    """
+    total = _Saved_NS()
+    for match in _timedelta_token.finditer(str):
+        unexpected = match.group('unexpected')
+        if unexpected:
+            raise ValueError(f"Unexpected {unexpected!r}")
+        total += _parse_timedelta_part(match)
+    return total
+
+
+_unit_lookup = {
+    'µs': 'microsecond',
+    'µsec': 'microsecond',
+    'us': 'microsecond',
+    'usec': 'microsecond',
+    'micros': 'microsecond',
     'ms': 'millisecond',
     'msec': 'millisecond',
     'millis': 'millisecond',
@@ -812,7 +2374,7 @@ class _Saved_NS:
             td=self.td + other.td, nanoseconds=self.nanoseconds + other.nanoseconds
         )
 
-    @property
+    @functools.cached_property
     def total_nanoseconds(self) -> decimal.Decimal:
         """
         The full parsed value expressed in nanoseconds, retaining
@@ -826,6 +2388,10 @@ class _Saved_NS:
         Resolve to a timedelta, rounding to the nearest microsecond
         (discarding any nanosecond resolution).
         """
+        return self._resolved
+
+    @functools.cached_property
+    def _resolved(self) -> datetime.timedelta:
         micros = round(self.total_nanoseconds / 1000)
         return datetime.timedelta(microseconds=micros)
 
@@ -836,8 +2402,9 @@ class _Saved_NS:
 def date_range(
     start: datetime.datetime | None = None,
     stop: datetime.datetime | None = None,
-    step: datetime.timedelta | None = None,
-) -> Iterator[datetime.datetime]:
+    step: datetime.timedelta | str | None = None,
+    holidays: Iterable[datetime.date] = (),
+) -> DateRange | MonthRange | BusinessDayRange:
     """
     Much like the built-in function range, but works with dates
 
@@ -853,50 +2420,1384 @@ def date_range(
     >>> datetime.datetime(2005,12,25) in my_range
     False
     >>> from_now = date_range(stop=datetime.datetime(2099, 12, 31))
-    >>> next(from_now)
+    >>> next(iter(from_now))
     datetime.datetime(...)
+
+    The result is a :class:`DateRange`, so it may be indexed, sized
+    and iterated repeatedly without stepping through its items.
+
+    >>> range_items[-1], len(range_items)
+    (datetime.datetime(2005, 12, 24, 0, 0), 4)
+
+    The step may also be a calendar unit (``month``, ``quarter`` or
+    ``year``; see :class:`MonthRange`) or ``business day`` (skipping
+    weekends and ``holidays``; see :class:`BusinessDayRange`).
+
+    >>> month_ends = date_range(
+    ...     datetime.datetime(2024, 1, 31),
+    ...     datetime.datetime(2024, 12, 31),
+    ...     'quarter',
+    ... )
+    >>> [item.date().isoformat() for item in month_ends]
+    ['2024-01-31', '2024-04-30', '2024-07-31', '2024-10-31']
+
+    Unit names are case-insensitive.
+
+    >>> len(date_range(month_ends[0], month_ends[-1], 'Business Day'))
+    196
     """
     if step is None:
         step = datetime.timedelta(days=1)
     if start is None:
         start = datetime.datetime.now()
-    while start < stop:  # type: ignore[operator]  # stop may be None if not provided
-        yield start
-        start += step
-
-
-tzinfos = dict(
-    AEST=dateutil.tz.gettz("Australia/Sydney"),
-    AEDT=dateutil.tz.gettz("Australia/Sydney"),
-    ACST=dateutil.tz.gettz("Australia/Darwin"),
-    ACDT=dateutil.tz.gettz("Australia/Adelaide"),
-    AWST=dateutil.tz.gettz("Australia/Perth"),
-    EST=dateutil.tz.gettz("America/New_York"),
-    EDT=dateutil.tz.gettz("America/New_York"),
-    CST=dateutil.tz.gettz("America/Chicago"),
-    CDT=dateutil.tz.gettz("America/Chicago"),
-    MST=dateutil.tz.gettz("America/Denver"),
-    MDT=dateutil.tz.gettz("America/Denver"),
-    PST=dateutil.tz.gettz("America/Los_Angeles"),
-    PDT=dateutil.tz.gettz("America/Los_Angeles"),
-    GMT=dateutil.tz.gettz("Etc/GMT"),
-    UTC=dateutil.tz.gettz("UTC"),
-    CET=dateutil.tz.gettz("Europe/Berlin"),
-    CEST=dateutil.tz.gettz("Europe/Berlin"),
-    IST=dateutil.tz.gettz("Asia/Kolkata"),
-    BST=dateutil.tz.gettz("Europe/London"),
-    MSK=dateutil.tz.gettz("Europe/Moscow"),
-    EET=dateutil.tz.gettz("Europe/Helsinki"),
-    EEST=dateutil.tz.gettz("Europe/Helsinki"),
+    if isinstance(step, str):
+        step = step.lower()
+    if step == 'business day':
+        return BusinessDayRange(start, stop, holidays)  # type: ignore[arg-type]
+    if isinstance(step, str):
+        try:
+            months = _calendar_months[step]
+        except KeyError:
+            raise ValueError("step not in (month, quarter, year, business day)")
+        return MonthRange(start, stop, months)  # type: ignore[arg-type]
+    return DateRange(start, stop, step)  # type: ignore[arg-type]  # stop may be None if not provided
+
+
+class _IndexedRange(Sequence[datetime.datetime]):
+    """
+    A sequence of datetimes, each computed from its index, supporting
+    lazy iteration, slicing and positional lookup.
+    """
+
+    @abc.abstractmethod
+    def __len__(self) -> int: ...
+
+    @abc.abstractmethod
+    def _item(self, index: int) -> datetime.datetime:
+        """
+        The item at (non-negative, in range) index.
+        """
+
+    @abc.abstractmethod
+    def _position(self, value: object) -> int | None:
+        """
+        The index of value, or None if it's not in the range.
+        """
+
+    @overload
+    def __getitem__(self, index: int) -> datetime.datetime: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> _IndexedRange: ...
+
+    def __getitem__(self, index: int | slice) -> datetime.datetime | _IndexedRange:
+        if isinstance(index, slice):
+            return _RangeView(self, range(len(self))[index])
+        try:
+            return self._item(range(len(self))[index])
+        except IndexError:
+            raise IndexError(f"{type(self).__name__} index out of range") from None
+
+    def __iter__(self) -> Iterator[datetime.datetime]:
+        return map(self._item, range(len(self)))
+
+    def __reversed__(self) -> Iterator[datetime.datetime]:
+        return map(self._item, reversed(range(len(self))))
+
+    def __contains__(self, value: object) -> bool:
+        return self._position(value) is not None
+
+    def index(self, value: object, start: int = 0, stop: int | None = None) -> int:
+        position = self._position(value)
+        if position is None or position not in range(len(self))[start:stop]:
+            raise ValueError(f"{value!r} is not in range")
+        return position
+
+    def count(self, value: object) -> int:
+        return int(value in self)
+
+
+class _RangeView(_IndexedRange):
+    """
+    The items of a range at some indices (as given by a slice).
+
+    >>> quarters = MonthRange(
+    ...     datetime.datetime(2024, 1, 1), datetime.datetime(2025, 1, 1), 3
+    ... )
+    >>> backward = quarters[::-1]
+    >>> backward
+    MonthRange(...)[3:None:-1]
+    >>> [item.month for item in backward]
+    [10, 7, 4, 1]
+    """
+
+    def __init__(self, parent: _IndexedRange, indices: range) -> None:
+        self.parent = parent
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def _item(self, index: int) -> datetime.datetime:
+        return self.parent._item(self.indices[index])
+
+    def _position(self, value: object) -> int | None:
+        position = self.parent._position(value)
+        if position is None or position not in self.indices:
+            return None
+        return self.indices.index(position)
+
+    def __repr__(self) -> str:
+        start, stop, step = self.indices.start, self.indices.stop, self.indices.step
+        if not self.indices:
+            start = stop = 0
+        elif stop < 0:
+            # reversed through the first item
+            stop = None
+        return f'{self.parent!r}[{start}:{stop}:{step}]'
+
+
+class DateRange(_IndexedRange):
+    """
+    An immutable sequence of datetimes from start (inclusive) to stop
+    (exclusive) by step, computed arithmetically like :class:`range`.
+
+    >>> days = DateRange(
+    ...     datetime.datetime(2024, 1, 1),
+    ...     datetime.datetime(2025, 1, 1),
+    ...     datetime.timedelta(hours=6),
+    ... )
+    >>> len(days)
+    1464
+    >>> days[1000]
+    datetime.datetime(2024, 9, 7, 0, 0)
+    >>> datetime.datetime(2024, 9, 7) in days, datetime.datetime(2024, 9, 7, 1) in days
+    (True, False)
+    >>> days.index(datetime.datetime(2024, 9, 7))
+    1000
+
+    Slices are ranges too.
+
+    >>> days[::-4][:2]
+    DateRange(datetime.datetime(2024, 12, 31, 18, 0), datetime.datetime(2024, 12, 29, 18, 0), datetime.timedelta(days=-1))
+    >>> list(reversed(days[:2]))
+    [datetime.datetime(2024, 1, 1, 6, 0), datetime.datetime(2024, 1, 1, 0, 0)]
+
+    With a zone-aware start, steps are taken in local wall time,
+    so daily items keep their time of day across DST changes.
+
+    >>> import zoneinfo
+    >>> zone = zoneinfo.ZoneInfo('America/New_York')
+    >>> mornings = DateRange(
+    ...     datetime.datetime(2024, 3, 9, 9, tzinfo=zone),
+    ...     datetime.datetime(2024, 3, 11, 10, tzinfo=zone),
+    ... )
+    >>> [item.strftime('%d %H:%M %Z') for item in mornings]
+    ['09 09:00 EST', '10 09:00 EDT', '11 09:00 EDT']
+    """
+
+    def __init__(
+        self,
+        start: datetime.datetime,
+        stop: datetime.datetime,
+        step: datetime.timedelta = datetime.timedelta(days=1),
+    ) -> None:
+        if stop is None:
+            raise TypeError("stop is required")
+        self._step_us = _timedelta_microseconds(step)
+        if not self._step_us:
+            raise ValueError("step must not be zero")
+        self.start, self.stop, self.step = start, stop, step
+        span = _timedelta_microseconds(stop - start)
+        self._indices = range(max(0, -(-span // self._step_us)))
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> datetime.datetime: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> DateRange: ...
+
+    def __getitem__(self, index: int | slice) -> datetime.datetime | DateRange:
+        if not isinstance(index, slice):
+            return super().__getitem__(index)
+        indices = self._indices[index]
+        return DateRange(
+            self.start + self.step * indices.start,
+            self.start + self.step * indices.stop,
+            self.step * indices.step,
+        )
+
+    def _item(self, index: int) -> datetime.datetime:
+        return self.start + self.step * index
+
+    def __iter__(self) -> Iterator[datetime.datetime]:
+        value = self.start
+        for _ in self._indices:
+            yield value
+            value += self.step
+
+    def _position(self, value: object) -> int | None:
+        if not isinstance(value, datetime.date):
+            return None
+        try:
+            offset = _timedelta_microseconds(value - self.start)  # type: ignore[operator]
+        except TypeError:
+            return None
+        position, remainder = divmod(offset, self._step_us)
+        return position if not remainder and position in self._indices else None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateRange):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self) -> tuple[object, ...]:
+        # like range, ranges are equal if they have the same items
+        if len(self) > 1:
+            return len(self), self.start, self.step
+        return (len(self), self.start) if self else (0,)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.start!r}, {self.stop!r}, {self.step!r})'
+
+    def epochs(self, unit: str = 'us') -> array.array[int]:
+        """
+        The items as integers since the epoch in ``unit`` (``s``, ``ms``,
+        ``us`` or ``ns``), taking naive datetimes as UTC, computed
+        without constructing each datetime.
+
+        >>> minutes = date_range(
+        ...     datetime.datetime(2024, 1, 1),
+        ...     datetime.datetime(2024, 1, 1, 0, 3),
+        ...     datetime.timedelta(minutes=1),
+        ... )
+        >>> minutes.epochs('s')
+        array('q', [1704067200, 1704067260, 1704067320])
+
+        (Such an array may be viewed as NumPy ``datetime64`` without copying,
+        using ``numpy.frombuffer``.)
+        """
+        scale = _get_epoch_scale(unit)
+        zone = self.start.tzinfo
+        if zone is not None and not isinstance(zone, datetime.timezone):
+            # offsets may vary, so convert each item
+            values = (_epoch_microseconds(item) for item in self)
+            return array.array('q', [_from_microseconds(v, scale) for v in values])
+        first = _from_microseconds(_epoch_microseconds(self.start), scale)
+        step = _from_microseconds(self._step_us, scale)
+        return array.array('q', range(first, first + len(self) * step, step))
+
+    def epoch_chunks(self, size: int, unit: str = 'us') -> Iterator[array.array[int]]:
+        """
+        Yield the :meth:`epochs` in arrays of up to ``size`` items.
+
+        >>> hours = date_range(
+        ...     datetime.datetime(2024, 1, 1),
+        ...     datetime.datetime(2024, 1, 1, 5),
+        ...     datetime.timedelta(hours=1),
+        ... )
+        >>> [len(chunk) for chunk in hours.epoch_chunks(2, 's')]
+        [2, 2, 1]
+        """
+        for offset in range(0, len(self), size):
+            yield self[offset : offset + size].epochs(unit)
+
+
+def _from_microseconds(micros: int, scale: int) -> int:
+    """
+    Convert micros to units of 1 / scale seconds, exactly.
+
+    >>> _from_microseconds(1_500_000, 10**3), _from_microseconds(3, 10**9)
+    (1500, 3000)
+    >>> _from_microseconds(1_500_000, 1)
+    Traceback (most recent call last):
+    ...
+    ValueError: 1500000 microseconds is not a whole number of units
+    """
+    if scale >= 10**6:
+        return micros * (scale // 10**6)
+    whole, part = divmod(micros, 10**6 // scale)
+    if part:
+        raise ValueError(f"{micros} microseconds is not a whole number of units")
+    return whole
+
+
+def _add_months(moment: datetime.datetime, months: int) -> datetime.datetime:
+    """
+    Add months to moment (in wall time), clamping the day to the end
+    of the resulting month.
+
+    >>> _add_months(datetime.datetime(2024, 1, 31, 9), 1)
+    datetime.datetime(2024, 2, 29, 9, 0)
+    >>> _add_months(datetime.datetime(2024, 1, 31), -14)
+    datetime.datetime(2022, 11, 30, 0, 0)
+    """
+    year, month = divmod(moment.year * 12 + moment.month - 1 + months, 12)
+    day = min(moment.day, calendar.monthrange(year, month + 1)[1])
+    return moment.replace(year=year, month=month + 1, day=day)
+
+
+class MonthRange(_IndexedRange):
+    """
+    Datetimes every ``months`` calendar months from start (inclusive)
+    to stop (exclusive), keeping the day of month (clamped to the end
+    of shorter months) and the wall time of start.
+
+    >>> ends = MonthRange(datetime.datetime(2024, 1, 31, 17), datetime.datetime(2025, 1, 1))
+    >>> len(ends), ends[1]
+    (12, datetime.datetime(2024, 2, 29, 17, 0))
+    >>> datetime.datetime(2024, 3, 31, 17) in ends
+    True
+    >>> ends.index(datetime.datetime(2024, 6, 30, 17))
+    5
+    >>> [item.month for item in ends[::-5]]
+    [12, 7, 2]
+
+    Negative steps count down.
+
+    >>> back = MonthRange(datetime.datetime(2024, 3, 31), datetime.datetime(2023, 12, 1), -1)
+    >>> [str(item.date()) for item in back]
+    ['2024-03-31', '2024-02-29', '2024-01-31', '2023-12-31']
+    """
+
+    def __init__(
+        self, start: datetime.datetime, stop: datetime.datetime, months: int = 1
+    ) -> None:
+        if not months:
+            raise ValueError("months must not be zero")
+        self.start, self.stop, self.months = start, stop, months
+        span = (stop.year - start.year) * 12 + stop.month - start.month
+        count = max(0, -(-span // months))
+        # the day of month and time may put the last item on either side of stop
+        while count and not self._before_stop(self._item(count - 1)):
+            count -= 1
+        while self._before_stop(self._item(count)):
+            count += 1
+        self._len = count
+
+    def _before_stop(self, moment: datetime.datetime) -> bool:
+        return moment < self.stop if self.months > 0 else moment > self.stop
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _item(self, index: int) -> datetime.datetime:
+        return _add_months(self.start, index * self.months)
+
+    def _position(self, value: object) -> int | None:
+        if not isinstance(value, datetime.datetime):
+            return None
+        span = (value.year - self.start.year) * 12 + value.month - self.start.month
+        index, remainder = divmod(span, self.months)
+        if remainder or index not in range(len(self)) or self._item(index) != value:
+            return None
+        return index
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.start!r}, {self.stop!r}, {self.months!r})'
+
+
+def _weekdays_before(ordinal: int) -> int:
+    """
+    The number of weekdays (Monday to Friday) before the day
+    with ordinal (counting from the Monday with ordinal 1).
+    """
+    weeks, days = divmod(ordinal - 1, 7)
+    return weeks * 5 + min(days, 5)
+
+
+class BusinessDayRange(_IndexedRange):
+    """
+    Datetimes at the wall time of start on each weekday, other than
+    holidays, from start (inclusive) to stop (exclusive).
+
+    Each item is computed directly from its index, jumping over weekends
+    and (by bisection) holidays.
+
+    >>> import zoneinfo
+    >>> zone = zoneinfo.ZoneInfo('America/New_York')
+    >>> days = BusinessDayRange(
+    ...     datetime.datetime(2024, 3, 7, 9, tzinfo=zone),
+    ...     datetime.datetime(2024, 3, 20, tzinfo=zone),
+    ...     holidays=[datetime.date(2024, 3, 12)],
+    ... )
+    >>> [item.strftime('%a %d %H:%M %Z') for item in days]
+    ['Thu 07 09:00 EST', 'Fri 08 09:00 EST', 'Mon 11 09:00 EDT', 'Wed 13 09:00 EDT', ...]
+    >>> len(days), days[6].day
+    (8, 18)
+    >>> datetime.datetime(2024, 3, 12, 9, tzinfo=zone) in days
+    False
+    >>> days.index(datetime.datetime(2024, 3, 19, 9, tzinfo=zone))
+    7
+    """
+
+    def __init__(
+        self,
+        start: datetime.datetime,
+        stop: datetime.datetime,
+        holidays: Iterable[datetime.date] = (),
+    ) -> None:
+        self.start, self.stop = start, stop
+        self.holidays = sorted(
+            {day.toordinal() for day in holidays if day.weekday() < 5}
+        )
+        # the business days before each holiday (non-decreasing)
+        self._holiday_indexes = [
+            _weekdays_before(ordinal) - count
+            for count, ordinal in enumerate(self.holidays)
+        ]
+        self._first = self._before(start.toordinal())
+        last = stop.toordinal()
+        if self._at(last) < stop:
+            last += 1
+        self._len = max(0, self._before(last) - self._first)
+
+    def _at(self, ordinal: int) -> datetime.datetime:
+        day = datetime.date.fromordinal(ordinal)
+        return datetime.datetime.combine(day, self.start.timetz())
+
+    def _before(self, ordinal: int) -> int:
+        """
+        The number of business days before the day with ordinal.
+        """
+        return _weekdays_before(ordinal) - bisect.bisect_left(self.holidays, ordinal)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _item(self, index: int) -> datetime.datetime:
+        # the holidays falling before the item, then the day
+        # following that many more weekdays
+        target = self._first + index
+        weekdays = target + bisect.bisect_right(self._holiday_indexes, target)
+        weeks, days = divmod(weekdays, 5)
+        return self._at(weeks * 7 + days + 1)
+
+    def _position(self, value: object) -> int | None:
+        if not isinstance(value, datetime.datetime):
+            return None
+        ordinal = value.toordinal()
+        index = self._before(ordinal) - self._first
+        if index not in range(len(self)) or self._item(index) != value:
+            return None
+        return index
+
+    def __repr__(self) -> str:
+        holidays = [datetime.date.fromordinal(ordinal) for ordinal in self.holidays]
+        return f'{type(self).__name__}({self.start!r}, {self.stop!r}, {holidays!r})'
+
+
+class Interval:
+    """
+    A half-open span of time, from start (inclusive) to end (exclusive).
+
+    >>> day = Interval(datetime.datetime(2024, 7, 26), datetime.datetime(2024, 7, 27))
+    >>> datetime.datetime(2024, 7, 26, 23, 59) in day
+    True
+    >>> datetime.datetime(2024, 7, 27) in day
+    False
+    >>> day.duration
+    datetime.timedelta(days=1)
+
+    Endpoints may be any ordered values that subtract, such as
+    epoch seconds, and unpack as a pair.
+
+    >>> start, end = Interval(10, 20)
+    >>> Interval(10, 20).overlaps(Interval(20, 30))
+    False
+    >>> Interval(10, 20).overlaps(Interval(15, 30))
+    True
+    >>> bool(Interval(10, 10))
+    False
+    >>> Interval(20, 10)
+    Traceback (most recent call last):
+    ...
+    ValueError: Interval end precedes its start
+    """
+
+    __slots__ = ('end', 'start')
+
+    def __init__(self, start: Any, end: Any) -> None:
+        if end < start:
+            raise ValueError("Interval end precedes its start")
+        self.start, self.end = start, end
+
+    def __iter__(self) -> Iterator[Any]:
+        yield self.start
+        yield self.end
+
+    def __contains__(self, moment: Any) -> bool:
+        return self.start <= moment < self.end
+
+    def __bool__(self) -> bool:
+        return self.start < self.end
+
+    @property
+    def duration(self) -> Any:
+        return self.end - self.start
+
+    def overlaps(self, other: Interval) -> bool:
+        return self.start < other.end and other.start < self.end
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return (self.start, self.end) == (other.start, other.end)
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.end))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.start!r}, {self.end!r})'
+
+
+def _coalesce(pairs: Iterable[tuple[Any, Any]]) -> tuple[list[Any], list[Any]]:
+    """
+    Merge non-empty (start, end) pairs, sorted by start, wherever
+    they overlap or abut, into lists of starts and ends.
+    """
+    starts: list[Any] = []
+    ends: list[Any] = []
+    for start, end in pairs:
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class IntervalSet:
+    """
+    A normalized set of half-open intervals: sorted, disjoint, and
+    with overlapping or abutting intervals merged.
+
+    Construct from Intervals or (start, end) pairs in any order.
+
+    >>> def at(hour):
+    ...     return datetime.datetime(2024, 7, 26, hour)
+    >>> def hours(intervals):
+    ...     return [(item.start.hour, item.end.hour) for item in intervals]
+    >>> down = IntervalSet([(at(9), at(10)), (at(2), at(4)), (at(3), at(5)), (at(5), at(6))])
+    >>> hours(down)
+    [(2, 6), (9, 10)]
+    >>> down.total()
+    datetime.timedelta(seconds=18000)
+
+    Sets combine in linear time by sweeping their sorted endpoints.
+
+    >>> window = IntervalSet([(at(3), at(12))])
+    >>> hours(down & window)
+    [(3, 6), (9, 10)]
+    >>> hours(window - down)
+    [(6, 9), (10, 12)]
+    >>> hours(down | window)
+    [(2, 12)]
+
+    Queries bisect the endpoints, costing O(log n) plus the
+    size of the result.
+
+    >>> at(5) in down, at(6) in down
+    (True, False)
+    >>> down.containing(at(9)).end.hour
+    10
+    >>> hours(down.overlapping(at(5), at(11)))
+    [(2, 6), (9, 10)]
+    >>> hours(down.clip(at(5), at(11)))
+    [(5, 6), (9, 10)]
+
+    Endpoints may be any ordered values, such as epoch seconds
+    (pass a suitable zero to total them).
+
+    >>> IntervalSet([(30, 40), (0, 10), (5, 20)]).total(0)
+    30
+    """
+
+    __slots__ = ('_ends', '_starts')
+    _starts: list[Any]
+    _ends: list[Any]
+
+    def __init__(self, intervals: Iterable[Interval | tuple[Any, Any]] = ()) -> None:
+        pairs = []
+        for start, end in intervals:
+            if end < start:
+                raise ValueError("Interval end precedes its start")
+            if start < end:
+                pairs.append((start, end))
+        pairs.sort(key=operator.itemgetter(0))
+        self._starts, self._ends = _coalesce(pairs)
+
+    @classmethod
+    def _make(cls, starts: list[Any], ends: list[Any]) -> IntervalSet:
+        result = object.__new__(cls)
+        result._starts, result._ends = starts, ends
+        return result
+
+    @classmethod
+    def _coerce(cls, other: Iterable[Interval | tuple[Any, Any]]) -> IntervalSet:
+        return other if isinstance(other, IntervalSet) else cls(other)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return map(Interval, self._starts, self._ends)
+
+    def __getitem__(self, index: int) -> Interval:
+        return Interval(self._starts[index], self._ends[index])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return (self._starts, self._ends) == (other._starts, other._ends)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
+
+    def __contains__(self, moment: Any) -> bool:
+        return self.containing(moment) is not None
+
+    def containing(self, moment: Any) -> Interval | None:
+        """
+        The interval containing moment, if any.
+        """
+        index = bisect.bisect_right(self._starts, moment) - 1
+        if index < 0 or not moment < self._ends[index]:
+            return None
+        return self[index]
+
+    def _span(self, start: Any, end: Any) -> slice:
+        return slice(
+            bisect.bisect_right(self._ends, start),
+            bisect.bisect_left(self._starts, end),
+        )
+
+    def overlapping(self, start: Any, end: Any) -> IntervalSet:
+        """
+        The intervals overlapping [start, end), whole.
+        """
+        span = self._span(start, end)
+        return self._make(self._starts[span], self._ends[span])
+
+    def clip(self, start: Any, end: Any) -> IntervalSet:
+        """
+        The parts of the intervals within [start, end).
+        """
+        span = self._span(start, end)
+        starts, ends = self._starts[span], self._ends[span]
+        if starts:
+            starts[0] = max(starts[0], start)
+            ends[-1] = min(ends[-1], end)
+        return self._make(starts, ends)
+
+    def total(self, zero: Any = datetime.timedelta()) -> Any:
+        """
+        The combined duration of the intervals, added to zero.
+        """
+        return sum(map(operator.sub, self._ends, self._starts), zero)
+
+    def union(self, other: Iterable[Interval | tuple[Any, Any]]) -> IntervalSet:
+        other = self._coerce(other)
+        pairs = heapq.merge(
+            zip(self._starts, self._ends),
+            zip(other._starts, other._ends),
+            key=operator.itemgetter(0),
+        )
+        return self._make(*_coalesce(pairs))
+
+    def intersection(self, other: Iterable[Interval | tuple[Any, Any]]) -> IntervalSet:
+        other = self._coerce(other)
+        starts: list[Any] = []
+        ends: list[Any] = []
+        mine = other_index = 0
+        while mine < len(self) and other_index < len(other):
+            start = max(self._starts[mine], other._starts[other_index])
+            end = min(self._ends[mine], other._ends[other_index])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+            if self._ends[mine] < other._ends[other_index]:
+                mine += 1
+            else:
+                other_index += 1
+        return self._make(starts, ends)
+
+    def difference(self, other: Iterable[Interval | tuple[Any, Any]]) -> IntervalSet:
+        other = self._coerce(other)
+        starts: list[Any] = []
+        ends: list[Any] = []
+        first = 0
+        for start, end in zip(self._starts, self._ends):
+            while first < len(other) and other._ends[first] <= start:
+                first += 1
+            index = first
+            while index < len(other) and other._starts[index] < end:
+                if start < other._starts[index]:
+                    starts.append(start)
+                    ends.append(other._starts[index])
+                start = other._ends[index]
+                index += 1
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+        return self._make(starts, ends)
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.difference(other)
+
+
+_default_zones = dict(
+    AEST="Australia/Sydney",
+    AEDT="Australia/Sydney",
+    ACST="Australia/Darwin",
+    ACDT="Australia/Adelaide",
+    AWST="Australia/Perth",
+    EST="America/New_York",
+    EDT="America/New_York",
+    CST="America/Chicago",
+    CDT="America/Chicago",
+    MST="America/Denver",
+    MDT="America/Denver",
+    PST="America/Los_Angeles",
+    PDT="America/Los_Angeles",
+    GMT="Etc/GMT",
+    UTC="UTC",
+    CET="Europe/Berlin",
+    CEST="Europe/Berlin",
+    IST="Asia/Kolkata",
+    BST="Europe/London",
+    MSK="Europe/Moscow",
+    EET="Europe/Helsinki",
+    EEST="Europe/Helsinki",
     # Add more mappings as needed
 )
 
 
+class ZoneResolver(MutableMapping[str, Any]):
+    """
+    Mapping of timezone abbreviations to zones, suitable for passing
+    as ``tzinfos`` to :func:`parse`.
+
+    Zones given by name are resolved by ``factory`` (``dateutil.tz.gettz``
+    by default) on first access and cached thereafter.
+
+    >>> zones = ZoneResolver(EST="America/New_York")
+    >>> 'EST' in zones, len(zones)
+    (True, 1)
+    >>> zones['EST'] is zones['EST']
+    True
+    >>> zones['EST']
+    tzfile('.../New_York')
+
+    Zones may also be given or assigned directly.
+
+    >>> zones['Z'] = datetime.timezone.utc
+    >>> sorted(zones)
+    ['EST', 'Z']
+
+    Extend another resolver without resolving (or mutating) it.
+
+    >>> more = ZoneResolver(zones, HKT='Asia/Hong_Kong')
+    >>> sorted(more), sorted(zones)
+    (['EST', 'HKT', 'Z'], ['EST', 'Z'])
+    >>> parse('2024-07-26 12:59:00 HKT', tzinfos=more)
+    datetime.datetime(2024, 7, 26, 12, 59, tzinfo=tzfile('.../Hong_Kong'))
+    """
+
+    def __init__(
+        self,
+        names: Mapping[str, str | datetime.tzinfo | None] | None = None,
+        /,
+        factory: Callable[[str], datetime.tzinfo | None] | None = None,
+        **more: str | datetime.tzinfo | None,
+    ) -> None:
+        self._names: dict[str, str] = {}
+        self._zones: dict[str, datetime.tzinfo | None] = {}
+        self._factory = factory
+        if isinstance(names, ZoneResolver):
+            self._names.update(names._names)
+            self._zones.update(names._zones)
+            self._factory = factory or names._factory
+            names = None
+        for abbr, zone in {**(names or {}), **more}.items():
+            self[abbr] = zone
+
+    def __getitem__(self, abbr: str) -> datetime.tzinfo | None:
+        try:
+            return self._zones[abbr]
+        except KeyError:
+            pass
+        zone = self._zones[abbr] = self._resolve(self._names[abbr])
+        return zone
+
+    def _resolve(self, name: str) -> datetime.tzinfo | None:
+        if self._factory is not None:
+            return self._factory(name)
+        import dateutil.tz
+
+        return dateutil.tz.gettz(name)
+
+    def __setitem__(self, abbr: str, zone: str | datetime.tzinfo | None) -> None:
+        self._zones.pop(abbr, None)
+        self._names.pop(abbr, None)
+        if isinstance(zone, str):
+            self._names[abbr] = zone
+        else:
+            self._zones[abbr] = zone
+
+    def __delitem__(self, abbr: str) -> None:
+        if abbr not in self:
+            raise KeyError(abbr)
+        self._names.pop(abbr, None)
+        self._zones.pop(abbr, None)
+
+    def __contains__(self, abbr: object) -> bool:
+        return abbr in self._zones or abbr in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter({**self._names, **self._zones})
+
+    def __len__(self) -> int:
+        return len({**self._names, **self._zones})
+
+    @classmethod
+    def from_tzdb(
+        cls,
+        year: int | None = None,
+        factory: Callable[[str], datetime.tzinfo | None] | None = None,
+        **overrides: str | datetime.tzinfo | None,
+    ) -> ZoneResolver:
+        """
+        Build a resolver for every alphabetic abbreviation in use in
+        the local timezone database during ``year`` (this year by
+        default).
+
+        Finding the abbreviations reads every zone in the database
+        (once per year, then cached), but the zones returned are
+        made by ``factory`` only as each abbreviation is looked up.
+
+        An abbreviation shared by several zones resolves to the
+        :data:`tzinfos` default, else the first such zone by name
+        within a geographic region; pass ``overrides`` to choose
+        otherwise.
+
+        >>> zones = ZoneResolver.from_tzdb(2024, IST='Asia/Jerusalem')
+        >>> len(zones) > len(tzinfos)
+        True
+        >>> zones['EST'], zones['IST'], zones['JST']
+        (tzfile('.../New_York'), tzfile('.../Jerusalem'), tzfile('.../Tokyo'))
+        """
+        names = _tzdb_abbreviations(year or datetime.date.today().year)
+        return cls({**names, **_default_zones}, factory, **overrides)
+
+
+_tz_regions = {
+    'Africa',
+    'America',
+    'Asia',
+    'Atlantic',
+    'Australia',
+    'Europe',
+    'Indian',
+    'Pacific',
+}
+
+
+@functools.lru_cache
+def _tzdb_abbreviations(year: int) -> dict[str, str]:
+    """
+    Map each alphabetic abbreviation used in the timezone database
+    at the start or middle of year to the first zone using it,
+    preferring zones in the geographic regions.
+    """
+    import zoneinfo
+
+    def regional(key: str) -> tuple[bool, str]:
+        return key.partition('/')[0] not in _tz_regions, key
+
+    names: dict[str, str] = {}
+    for key in sorted(zoneinfo.available_timezones(), key=regional):
+        try:
+            zone = zoneinfo.ZoneInfo(key)
+        except (ValueError, OSError):
+            continue
+        for month in (1, 7):
+            abbr = datetime.datetime(year, month, 1, tzinfo=zone).tzname()
+            if abbr and abbr.isalpha():
+                names.setdefault(abbr, key)
+    return names
+
+
+tzinfos = ZoneResolver(_default_zones)
+"""
+Timezone abbreviations understood by :func:`parse`, resolved lazily.
+"""
+
+
+_iso_datetime = re.compile(
+    r'(?P<date>\d{4}-\d{2}-\d{2})'
+    r'(?:[T ](?P<time>\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)'
+    r'(?:(?P<offset>Z|[+-]\d{2}:?\d{2})|\s+(?P<zone>[A-Z]{2,5}))?)?',
+    re.ASCII,
+)
+
+_rfc2822 = re.compile(
+    r'(?:(?i:mon|tue|wed|thu|fri|sat|sun),\s*)?'
+    r'(?P<day>\d{1,2})\s+(?P<month>(?i:jan|feb|mar|apr|may|jun'
+    r'|jul|aug|sep|oct|nov|dec))\s+(?P<year>\d{4})\s+'
+    r'(?P<time>\d{2}:\d{2}(?::\d{2})?)\s+'
+    r'(?:(?P<offset>[+-]\d{4})|(?P<zone>[A-Z]{2,5}))',
+    re.ASCII,
+)
+
+_months = {
+    name: number
+    for number, name in enumerate(
+        'jan feb mar apr may jun jul aug sep oct nov dec'.split(), start=1
+    )
+}
+
+parse_stats: collections.Counter[str] = collections.Counter()
+"""
+Counts of calls to :func:`parse` served by the fast path (``fast``)
+or by dateutil (``fallback``).
+"""
+
+
+def _offset_tz(offset: str) -> datetime.tzinfo | None:
+    """
+    Resolve a numeric offset as dateutil would, or None for UTC
+    (which dateutil resolves by name).
+
+    >>> _offset_tz('-04:00')
+    tzoffset(None, -14400)
+    >>> _offset_tz('Z'), _offset_tz('+0000')
+    (None, None)
+    """
+    if offset == 'Z':
+        return None
+    import dateutil.tz
+
+    hours, minutes = int(offset[1:3]), int(offset[-2:])
+    seconds = (hours * 60 + minutes) * 60 * (-1 if offset[0] == '-' else 1)
+    return dateutil.tz.tzoffset(None, seconds) if seconds else None
+
+
+def _localize(
+    naive: datetime.datetime, zone: str, zones: Mapping[str, Any]
+) -> datetime.datetime | None:
+    """
+    Attach the zone named by abbreviation in ``zones``, preferring
+    the fold whose abbreviation matches (as dateutil does), or
+    return None if the abbreviation is unknown.
+    """
+    tzinfo = zones.get(zone)
+    if not isinstance(tzinfo, datetime.tzinfo):
+        return None
+    aware = naive.replace(tzinfo=tzinfo)
+    if aware.tzname() != zone:
+        import dateutil.tz
+
+        folded = dateutil.tz.enfold(aware, fold=1)
+        if folded.tzname() == zone:
+            return folded
+    return aware
+
+
+def _parse_fast(text: str, zones: Mapping[str, Any]) -> datetime.datetime | None:
+    """
+    Parse common ISO 8601, RFC 3339 and RFC 2822 forms, returning
+    the same result as dateutil would, or None if text is not in
+    one of those forms.
+    """
+    text = text.strip()
+    if match := _iso_datetime.fullmatch(text):
+        naive = datetime.datetime.fromisoformat(
+            match.group('date') + 'T' + (match.group('time') or '00:00')
+        )
+    elif match := _rfc2822.fullmatch(text):
+        month = _months[match.group('month').lower()]
+        naive = datetime.datetime.fromisoformat(
+            f"{match.group('year')}-{month:02d}-{int(match.group('day')):02d}"
+            f"T{match.group('time')}"
+        )
+    else:
+        return None
+    return _attach_tz(naive, match.group('offset'), match.group('zone'), zones)
+
+
+def _attach_tz(
+    naive: datetime.datetime,
+    offset: str | None,
+    zone: str | None,
+    zones: Mapping[str, Any],
+) -> datetime.datetime | None:
+    """
+    Attach the timezone given by a numeric offset or an abbreviation
+    as dateutil would, or return None if the abbreviation is unknown.
+    """
+    if offset:
+        if tzinfo := _offset_tz(offset):
+            return naive.replace(tzinfo=tzinfo)
+        zone = 'UTC'
+    if zone:
+        return _localize(naive, zone, zones)
+    return naive
+
+
 def parse(*args: Any, **kwargs: Any) -> datetime.datetime:
     """
     Parse the input using dateutil.parser.parse with friendly tz support.
 
     >>> parse('2024-07-26 12:59:00 EDT')
     datetime.datetime(...America/New_York...)
+
+    Common ISO 8601, RFC 3339 and RFC 2822 strings are parsed
+    directly, bypassing dateutil but giving the same result.
+
+    >>> parse('2024-07-26T12:59:00.5-04:00')
+    datetime.datetime(2024, 7, 26, 12, 59, 0, 500000, tzinfo=tzoffset(None, -14400))
+    >>> parse('Fri, 26 Jul 2024 16:59:00 GMT')
+    datetime.datetime(2024, 7, 26, 16, 59, tzinfo=...)
+
+    Pass ``tzinfos`` (such as a :class:`ZoneResolver`) to understand
+    other abbreviations.
+
+    >>> parse('2024-07-26 12:59:00 JST', tzinfos=ZoneResolver(JST='Asia/Tokyo'))
+    datetime.datetime(2024, 7, 26, 12, 59, tzinfo=tzfile('.../Tokyo'))
+
+    Inspect ``parse_stats`` for how often the fast path is taken.
+
+    >>> parse_stats.clear()
+    >>> _ = parse('2024-07-26'), parse('July 26, 2024')
+    >>> parse_stats
+    Counter({'fast': 1, 'fallback': 1})
+    """
+    zones = kwargs.pop('tzinfos', None)
+    if zones is None:
+        zones = tzinfos
+    fast = len(args) == 1 and not kwargs and isinstance(zones, Mapping)
+    if fast and isinstance(args[0], str):
+        try:
+            result = _parse_fast(args[0], zones)
+        except ValueError:
+            result = None
+        if result is not None:
+            parse_stats['fast'] += 1
+            return result
+    parse_stats['fallback'] += 1
+    import dateutil.parser
+
+    return dateutil.parser.parse(*args, tzinfos=zones, **kwargs)  # type: ignore[no-any-return]
+
+
+_month_numbers = {
+    name: number
+    for number, month in enumerate(
+        'january february march april may june july august'
+        ' september october november december'.split(),
+        start=1,
+    )
+    for name in (month, month[:3])
+}
+
+_weekday_names = {
+    name
+    for day in 'monday tuesday wednesday thursday friday saturday sunday'.split()
+    for name in (day, day[:3])
+}
+
+_datetime_token = re.compile(r'\d+|[A-Za-z]+|[^\dA-Za-z]+')
+
+_zone_suffix = re.compile(r'(?P<sep>\s*)(?P<zone>Z|[+-]\d{2}:?\d{2}|[A-Z]{2,5})$')
+
+_slot_patterns = dict(
+    year=r'(\d{4})',
+    month=r'(\d{1,2})',
+    day=r'(\d{1,2})',
+    hour=r'(\d{1,2})',
+    minute=r'(\d{1,2})',
+    second=r'(\d{1,2})',
+    microsecond=r'(\d{1,6})',
+    month_name=r'([A-Za-z]+)',
+    weekday=r'[A-Za-z]+',
+    zone=r'(Z|[+-]\d{2}:?\d{2}|[A-Z]{2,5})',
+)
+
+
+class _LearnedFormat:
+    """
+    A parser specialized to the layout of some sample timestamps,
+    returning None for text not in that layout.
+
+    >>> learned = _LearnedFormat.learn(['Fri, 26 Jul 2024 12:59:03.25 EST'])
+    >>> learned.fields
+    ['day', 'month_name', 'year', 'hour', 'minute', 'second', 'microsecond', 'zone']
+    >>> learned('Sat, 3 Aug 2024 01:02:03.5 -0400')
+    datetime.datetime(2024, 8, 3, 1, 2, 3, 500000, tzinfo=tzoffset(None, -14400))
+    >>> learned('2024-08-03')
+
+    Samples that leave fields ambiguous aren't learned.
+
+    >>> _LearnedFormat.learn(['07/07/2024 12:59'])
+
+    Where a day precedes a numeric month, text that :func:`parse`
+    would read month first (both being 12 or less) is left to it.
+
+    >>> day_first = _LearnedFormat.learn(['26/07/2024 12:59'])
+    >>> day_first('27/07/2024 13:00')
+    datetime.datetime(2024, 7, 27, 13, 0)
+    >>> day_first('03/08/2024 13:00')
+    """
+
+    def __init__(
+        self,
+        pattern: re.Pattern[str],
+        fields: Sequence[str],
+        zones: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.pattern = pattern
+        self.fields = fields
+        self.zones = zones
+        # parse reads ambiguous numeric dates month first
+        numeric = 'month' in fields
+        self.day_first = numeric and fields.index('day') < fields.index('month')
+
+    def __call__(self, text: str) -> datetime.datetime | None:
+        match = self.pattern.fullmatch(text.strip())
+        if not match:
+            return None
+        parts: dict[str, int] = {}
+        zone = None
+        for field, value in zip(self.fields, match.groups()):
+            if field == 'zone':
+                zone = value
+            elif field == 'month_name':
+                month = _month_numbers.get(value.lower())
+                if month is None:
+                    return None
+                parts['month'] = month
+            elif field == 'microsecond':
+                parts[field] = int(value.ljust(6, '0'))
+            else:
+                parts[field] = int(value)
+        if self.day_first and parts['day'] != parts['month']:
+            if max(parts['day'], parts['month']) <= 12:
+                return None
+        try:
+            naive = datetime.datetime(**parts)  # type: ignore[arg-type]
+        except ValueError:
+            return None
+        if zone is None:
+            return naive
+        numeric = zone == 'Z' or zone[0] in '+-'
+        return _attach_tz(
+            naive,
+            zone if numeric else None,
+            None if numeric else zone,
+            tzinfos if self.zones is None else self.zones,
+        )
+
+    @staticmethod
+    def _analyze(
+        text: str, parsed: datetime.datetime
+    ) -> tuple[list[str | None], list[set[str]]] | None:
+        """
+        Split text into its layout (literal text, or None for each
+        variable slot) and the fields that could fill each slot
+        given the parsed value.
+        """
+        layout: list[str | None] = []
+        options: list[set[str]] = []
+        zone = None
+        if parsed.tzinfo is not None:
+            suffix = _zone_suffix.search(text)
+            if not suffix:
+                return None
+            text, zone = text[: suffix.start()], suffix
+        values = dict(
+            year=parsed.year,
+            month=parsed.month,
+            day=parsed.day,
+            hour=parsed.hour,
+            minute=parsed.minute,
+            second=parsed.second,
+        )
+        previous = ''
+        for token in _datetime_token.findall(text):
+            name = token.lower()
+            if token.isdigit():
+                candidates = {
+                    field
+                    for field, value in values.items()
+                    if value == int(token) and (field == 'year') == (len(token) == 4)
+                }
+                fraction = previous in ('.', ',') and len(token) <= 6
+                if fraction and int(token.ljust(6, '0')) == parsed.microsecond:
+                    candidates.add('microsecond')
+                options.append(candidates)
+            elif _month_numbers.get(name) == parsed.month:
+                options.append({'month_name'})
+            elif name in _weekday_names:
+                options.append({'weekday'})
+            elif token.isalpha() and token != 'T':
+                return None
+            else:
+                layout.append(token)
+                previous = token
+                continue
+            layout.append(None)
+            previous = token
+        if zone:
+            layout.extend([zone.group('sep'), None])
+            options.append({'zone'})
+        return layout, options
+
+    @staticmethod
+    def _assign(options: list[set[str]]) -> list[str] | None:
+        """
+        Assign a distinct field to each slot, or return None if
+        the options are ambiguous or incomplete.
+        """
+        options = [set(candidates) for candidates in options]
+        settled: set[int] = set()
+        while unsettled := [
+            index
+            for index, candidates in enumerate(options)
+            if len(candidates) == 1 and index not in settled
+        ]:
+            for index in unsettled:
+                settled.add(index)
+                (field,) = options[index]
+                claimed = {field, 'month' if field == 'month_name' else field}
+                for other, candidates in enumerate(options):
+                    if other != index:
+                        candidates -= claimed
+        if any(len(candidates) != 1 for candidates in options):
+            return None
+        fields = [candidates.pop() for candidates in options]
+        required = {'year', 'day'} <= set(fields)
+        month = {'month', 'month_name'} & set(fields)
+        return fields if required and month else None
+
+    @classmethod
+    def learn(
+        cls, samples: Iterable[str], zones: Mapping[str, Any] | None = None
+    ) -> _LearnedFormat | None:
+        """
+        Learn the layout shared by samples, or return None if no
+        layout could be learned that reproduces :func:`parse`.
+        """
+        parsed = []
+        for text in samples:
+            with contextlib.suppress(ValueError, OverflowError):
+                parsed.append((text.strip(), parse(text, tzinfos=zones)))
+        layout = options = None
+        for text, value in parsed:
+            analysis = cls._analyze(text, value)
+            if analysis is None:
+                continue
+            if layout is None:
+                layout, options = analysis
+            elif analysis[0] == layout:
+                options = [
+                    ours & theirs
+                    for ours, theirs in zip(options, analysis[1])  # type: ignore[arg-type]
+                ]
+        if layout is None or options is None:
+            return None
+        if (fields := cls._assign(options)) is None:
+            return None
+        slots = iter(fields)
+        pattern = ''.join(
+            re.escape(literal) if literal is not None else _slot_patterns[next(slots)]
+            for literal in layout
+        )
+        learned = cls(re.compile(pattern), [f for f in fields if f != 'weekday'], zones)
+        results = [(learned(text), value) for text, value in parsed]
+        matched = [(result, value) for result, value in results if result is not None]
+        if matched and all(repr(result) == repr(value) for result, value in matched):
+            return learned
+        return None
+
+
+def _parse_learned(
+    learned: _LearnedFormat | None, text: str, zones: Mapping[str, Any] | None
+) -> datetime.datetime:
+    return (learned and learned(text)) or parse(text, tzinfos=zones)
+
+
+def _parse_chunk(
+    learned: _LearnedFormat | None, chunk: list[str], zones: Mapping[str, Any] | None
+) -> list[datetime.datetime]:
+    return [_parse_learned(learned, text, zones) for text in chunk]
+
+
+def parse_many(
+    strings: Iterable[str],
+    samples: int = 10,
+    processes: int | None = None,
+    chunksize: int = 10_000,
+    tzinfos: Mapping[str, Any] | None = None,
+) -> Iterator[datetime.datetime]:
+    """
+    Parse a stream of timestamps sharing a common format, yielding the
+    same results as :func:`parse` on each.
+
+    The format is learned from the first ``samples`` rows and compiled
+    into a specialized parser, so rows in that format avoid dateutil.
+    Rows that don't match fall back to :func:`parse`, which is
+    passed ``tzinfos``.
+
+    >>> rows = ['07/26/2024 12:59:03 -0400', '07/26/2024 13:00:07 -0400']
+    >>> for value in parse_many(rows + ['July 27, 2024']):
+    ...     print(value)
+    2024-07-26 12:59:03-04:00
+    2024-07-26 13:00:07-04:00
+    2024-07-27 00:00:00
+
+    Pass ``processes`` to parse chunks of ``chunksize`` rows in that
+    many worker processes (results remain in order).
+
+    >>> results = parse_many(rows * 1000, processes=2, chunksize=500)
+    >>> sum(1 for _ in results)
+    2000
     """
-    return dateutil.parser.parse(*args, tzinfos=tzinfos, **kwargs)  # type: ignore[no-any-return]
+    strings = iter(strings)
+    head = list(itertools.islice(strings, samples))
+    learned = _LearnedFormat.learn(head, tzinfos)
+    rows = itertools.chain(head, strings)
+    if not processes:
+        for text in rows:
+            yield _parse_learned(learned, text, tzinfos)
+        return
+    import concurrent.futures
+
+    chunks = iter(lambda: list(itertools.islice(rows, chunksize)), [])
+    with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+        pending: collections.deque[concurrent.futures.Future[list[datetime.datetime]]]
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_parse_chunk, learned, chunk, tzinfos))
+            if len(pending) > processes * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,563 @@
+"""
+Batch and fast paths checked against their general equivalents,
+with micro-benchmarks guarding the per-call overhead of hot paths.
+
+The timing checks are opt-in (set ``TEMPORA_BENCHMARKS=1``), as
+wall-clock bounds are unreliable on shared runners, under coverage,
+or on other interpreters. The bounds are deliberately generous; they
+catch accidental algorithmic regressions, not constant-factor drift
+across machines.
+"""
+
+from __future__ import annotations
+
+import array
+import collections
+import datetime
+import os
+import subprocess
+import sys
+import timeit
+import zoneinfo
+from collections.abc import Callable
+from typing import Any
+
+import dateutil.parser
+import dateutil.tz
+import pytest
+import tempora
+from tempora import timing
+
+timed = pytest.mark.skipif(
+    not os.environ.get('TEMPORA_BENCHMARKS'),
+    reason="timing checks run only with TEMPORA_BENCHMARKS set",
+)
+
+
+def per_call(func: Callable[[], Any], number: int = 10_000) -> float:
+    """
+    Return the best observed seconds per call of func.
+    """
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def assert_faster(
+    fast: Callable[[], Any], slow: Callable[[], Any], factor: float
+) -> None:
+    """
+    Assert that a single run of fast beats a run of slow by factor.
+    """
+    assert per_call(fast, 1) * factor < per_call(slow, 1)
+
+
+@timed
+@pytest.mark.parametrize(
+    'limiter',
+    [
+        timing.TokenBucket(10**9, 1),
+        timing.SlidingWindowLog(1000, 1),
+        timing.SlidingWindowCounter(10**9, 1),
+    ],
+    ids=type,
+)
+def test_rate_limiter_overhead(limiter: timing.RateLimiter) -> None:
+    assert per_call(limiter.try_acquire) < 20e-6
+
+
+common_durations = pytest.mark.parametrize(
+    'text', ['5s', '250ms', '1 day, 30 seconds', '14:00:35.362']
+)
+
+
+@timed
+@common_durations
+def test_parse_timedelta_latency(text: str) -> None:
+    """
+    Repeatedly parsed durations should be served from the memo.
+    """
+    assert per_call(lambda: tempora.parse_timedelta(text)) < 5e-6
+    assert per_call(lambda: tempora.parse_nanoseconds(text)) < 5e-6
+
+
+@timed
+def test_Duration_sum_overhead() -> None:
+    """
+    Summing whole-nanosecond durations should cost little more than int addition.
+    """
+    durations = [tempora.Duration(n) for n in range(1000)]
+    total = per_call(lambda: sum(durations, tempora.Duration()), number=100)
+    assert total / len(durations) < 2e-6
+
+
+iso_durations = pytest.mark.parametrize(
+    'iso, general',
+    [
+        ('PT5S', '5s'),
+        ('PT0.25S', '250ms'),
+        ('P1DT2H3M4.5S', '1 day, 2 hours, 3 minutes, 4.5 seconds'),
+    ],
+)
+
+parse_general = tempora._parse_timedelta_nanos.__wrapped__  # type: ignore[attr-defined]
+
+
+@iso_durations
+def test_parse_iso_duration(iso: str, general: str) -> None:
+    assert tempora.parse_iso_duration(iso) == parse_general(general).resolve()
+
+
+@timed
+@iso_durations
+def test_parse_iso_duration_latency(iso: str, general: str) -> None:
+    """
+    The dedicated ISO 8601 parser should beat the general parser
+    (bypassing its memo).
+    """
+    iso_time = per_call(lambda: tempora.parse_iso_duration(iso))
+    general_time = per_call(lambda: parse_general(general).resolve())
+    assert iso_time < general_time
+
+
+common_timestamps = pytest.mark.parametrize(
+    'text',
+    [
+        '2024-07-26T12:59:00Z',
+        '2024-07-26 12:59:00.250-04:00',
+        '2024-07-26 12:59:00 EDT',
+        'Fri, 26 Jul 2024 16:59:00 +0000',
+    ],
+)
+
+
+def parse_slowly(text: str) -> datetime.datetime:
+    return dateutil.parser.parse(text, tzinfos=tempora.tzinfos)
+
+
+@common_timestamps
+def test_parse_fast_path(text: str) -> None:
+    """
+    Common timestamp forms should bypass dateutil, matching its result.
+    """
+    tempora.parse_stats.clear()
+    assert tempora.parse(text) == parse_slowly(text)
+    assert tempora.parse_stats == {'fast': 1}
+
+
+@timed
+@common_timestamps
+def test_parse_fast_path_latency(text: str) -> None:
+    fast = per_call(lambda: tempora.parse(text), 1000)
+    assert fast * 3 < per_call(lambda: parse_slowly(text), 1000)
+
+
+log_rows = [
+    f'07/{day:02d}/2024 12:{minute:02d}:03 -0400'
+    for day in range(1, 29)
+    for minute in range(60)
+]
+
+
+def test_parse_many_learned_format() -> None:
+    """
+    A log stream in a format outside the fast path should be parsed
+    by the learned format, not row by row through dateutil.
+    """
+    tempora.parse_stats.clear()
+    assert list(tempora.parse_many(log_rows)) == list(map(parse_slowly, log_rows))
+    assert tempora.parse_stats == {'fallback': 10}
+
+
+def test_parse_many_ambiguous_day_first() -> None:
+    """
+    Rows that parse would read month first shouldn't take the order
+    of a day-first format learned from earlier rows.
+    """
+    rows = [f'{day:02d}/07/2024 10:31:{day + 20:02d}' for day in range(13, 23)]
+    rows.append('03/08/2024 12:01:04')
+    assert list(tempora.parse_many(rows)) == list(map(tempora.parse, rows))
+
+
+@timed
+def test_parse_many_learned_format_latency() -> None:
+    assert_faster(
+        lambda: list(tempora.parse_many(log_rows)),
+        lambda: [tempora.parse(row) for row in log_rows],
+        3,
+    )
+
+
+def import_times() -> dict[str, int]:
+    """
+    Import tempora in a fresh interpreter, returning the cumulative
+    import time (in microseconds) of each module loaded.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import tempora'],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    lines = [line.split('|') for line in proc.stderr.splitlines()[1:]]
+    return {name.strip(): int(cumulative) for _, cumulative, name in lines}
+
+
+def test_import_defers_dateutil() -> None:
+    """
+    Importing tempora should defer dateutil (and its tzfile reads)
+    until a timezone is needed.
+    """
+    assert not {name for name in import_times() if name.startswith('dateutil')}
+
+
+@timed
+def test_import_time() -> None:
+    assert import_times()['tempora'] < 500_000
+
+
+def test_zone_resolver_caches_lookups() -> None:
+    """
+    Parsing with a resolver should look up each zone only once.
+    """
+    names: list[str] = []
+
+    def factory(name: str) -> Any:
+        names.append(name)
+        return dateutil.tz.gettz(name)
+
+    zones = tempora.ZoneResolver.from_tzdb(2024, factory=factory)
+    text = '2024-07-26 12:59:00 JST'
+    expected = dateutil.parser.parse(text, tzinfos={'JST': factory('Asia/Tokyo')})
+    names.clear()
+    for _ in range(1000):
+        assert tempora.parse(text, tzinfos=zones) == expected
+    assert names == ['Asia/Tokyo']
+
+
+strftime_formats = pytest.mark.parametrize(
+    'fmt',
+    ['%Y-%m-%d %H:%M:%S.%s', '%a, %d %b %Y %H:%M:%S %z'],
+)
+
+sample_moment = datetime.datetime(2024, 7, 26, 12, 59, 3, 250000)
+
+
+@strftime_formats
+def test_strftime_compiled_once(fmt: str) -> None:
+    """
+    Repeated formatting should reuse the compiled format.
+    """
+    tempora.strftime(fmt, sample_moment)
+    misses = tempora.compile_strftime.cache_info().misses
+    for _ in range(1000):
+        tempora.strftime(fmt, sample_moment)
+    assert tempora.compile_strftime.cache_info().misses == misses
+
+
+@timed
+@strftime_formats
+def test_strftime_latency(fmt: str) -> None:
+    """
+    A compiled format should cost little more than the stdlib.
+    """
+    elapsed = per_call(lambda: tempora.strftime(fmt, sample_moment))
+    assert elapsed < per_call(lambda: sample_moment.strftime(fmt)) * 3
+
+
+utc_epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+naive_epoch = datetime.datetime(1970, 1, 1)
+microsecond = datetime.timedelta(microseconds=1)
+
+epoch_format = '%Y-%m-%d %H:%M:%S.%f %z'
+epoch_nanos = array.array(
+    'q', range(1_721_998_740 * 10**9, 1_722_002_340 * 10**9, 10**8)
+)
+
+
+def strftime_each() -> list[str]:
+    return [
+        tempora.strftime(
+            epoch_format, utc_epoch + datetime.timedelta(microseconds=ns // 1000)
+        )
+        for ns in epoch_nanos
+    ]
+
+
+def test_strftime_many_epochs() -> None:
+    """
+    Formatting a column of epoch nanoseconds should match converting
+    and formatting each value.
+    """
+    result = tempora.strftime_many(epoch_format, epoch_nanos, unit='ns')
+    assert result == strftime_each()
+
+
+@timed
+def test_strftime_many_epochs_latency() -> None:
+    assert_faster(
+        lambda: tempora.strftime_many(epoch_format, epoch_nanos, unit='ns'),
+        strftime_each,
+        2,
+    )
+
+
+five_minutes = datetime.timedelta(minutes=5)
+hour_micros = array.array(
+    'q', range(1_721_998_740 * 10**6, 1_722_002_340 * 10**6, 10**5)
+)
+
+
+def round_each() -> list[int]:
+    return [
+        (
+            tempora.datetime_round(
+                naive_epoch + datetime.timedelta(microseconds=us), five_minutes
+            )
+            - naive_epoch
+        )
+        // microsecond
+        for us in hour_micros
+    ]
+
+
+def test_datetime_round_many() -> None:
+    """
+    Bucketing a column of epoch microseconds should match the scalar
+    function.
+    """
+    result = tempora.datetime_round_many(hour_micros, five_minutes)
+    assert result.tolist() == round_each()
+
+
+@timed
+def test_datetime_round_many_latency() -> None:
+    assert_faster(
+        lambda: tempora.datetime_round_many(hour_micros, five_minutes),
+        round_each,
+        3,
+    )
+
+
+calendar_units = pytest.mark.parametrize(
+    'unit', ['day', 'week', 'month', 'quarter', 'year']
+)
+new_york = zoneinfo.ZoneInfo('America/New_York')
+year_micros = array.array(
+    'q',
+    range(
+        1_700_000_000 * 10**6,
+        1_700_000_000 * 10**6 + 400 * 86400 * 10**6,
+        1200 * 10**6,
+    ),
+)
+
+
+def calendar_floor_each(unit: str) -> list[int]:
+    return [
+        (
+            tempora.calendar_floor(
+                utc_epoch + datetime.timedelta(microseconds=us), unit, new_york
+            )
+            - utc_epoch
+        )
+        // microsecond
+        for us in year_micros
+    ]
+
+
+@calendar_units
+def test_calendar_floor_many(unit: str) -> None:
+    """
+    Bucketing epoch microseconds into local calendar periods should
+    match the scalar function.
+    """
+    result = tempora.calendar_floor_many(year_micros, unit, new_york)
+    assert result.tolist() == calendar_floor_each(unit)
+
+
+@timed
+@calendar_units
+def test_calendar_floor_many_latency(unit: str) -> None:
+    assert_faster(
+        lambda: tempora.calendar_floor_many(year_micros, unit, new_york),
+        lambda: calendar_floor_each(unit),
+        3,
+    )
+
+
+day_micros = array.array(
+    'q', range(1_721_998_740 * 10**6, 1_722_085_140 * 10**6, 10**7)
+)
+
+
+def count_each() -> collections.Counter[str]:
+    fmt = tempora.get_date_format_string('hour')
+    return collections.Counter(
+        tempora.strftime(fmt, naive_epoch + datetime.timedelta(microseconds=us))
+        for us in day_micros
+    )
+
+
+def count_grouped() -> tempora.TimeBuckets:
+    buckets = tempora.TimeBuckets('hour')
+    buckets.update(day_micros)
+    return buckets
+
+
+def test_TimeBuckets_update() -> None:
+    """
+    Grouping epoch microseconds by period should match formatting
+    a key for each timestamp.
+    """
+    assert {key: count for key, count, _ in count_grouped().items()} == count_each()
+
+
+@timed
+def test_TimeBuckets_update_latency() -> None:
+    assert_faster(count_grouped, count_each, 5)
+
+
+def second_range() -> tuple[tempora.DateRange, datetime.datetime]:
+    start = datetime.datetime(2000, 1, 1)
+    seconds = tempora.date_range(
+        start, datetime.datetime(2100, 1, 1), datetime.timedelta(seconds=1)
+    )
+    return seconds, start + datetime.timedelta(days=20_000, seconds=1)
+
+
+def test_date_range_index() -> None:
+    seconds, target = second_range()
+    assert seconds[seconds.index(target)] == target
+
+
+@timed
+def test_date_range_constant_time() -> None:
+    """
+    Sizing, indexing and membership in a date range shouldn't
+    depend on its length.
+    """
+    seconds, target = second_range()
+    assert per_call(lambda: len(seconds)) < 20e-6
+    assert per_call(lambda: seconds[1_000_000_000]) < 20e-6
+    assert per_call(lambda: seconds.index(target)) < 20e-6
+
+
+minutes = tempora.date_range(
+    datetime.datetime(2024, 1, 1),
+    datetime.datetime(2024, 2, 1),
+    datetime.timedelta(minutes=1),
+)
+
+
+def epoch_seconds_each() -> list[int]:
+    return [(item - naive_epoch) // datetime.timedelta(seconds=1) for item in minutes]
+
+
+def test_date_range_epochs() -> None:
+    """
+    Materializing a range as epoch seconds should match converting
+    each datetime.
+    """
+    assert minutes.epochs('s').tolist() == epoch_seconds_each()
+
+
+@timed
+def test_date_range_epochs_latency() -> None:
+    assert_faster(lambda: minutes.epochs('s'), epoch_seconds_each, 3)
+
+
+business_holidays = [
+    datetime.date(year, month, day)
+    for year in range(2000, 2400)
+    for month, day in [(1, 1), (7, 4), (12, 25)]
+]
+business_days = tempora.date_range(
+    datetime.datetime(2000, 1, 3),
+    datetime.datetime(2400, 1, 1),
+    'business day',
+    holidays=business_holidays,
+)
+
+
+def test_business_day_range_indexing() -> None:
+    target = business_days[100_000]
+    assert target.weekday() < 5 and target.date() not in set(business_holidays)
+    assert business_days.index(target) == 100_000
+
+
+@timed
+def test_business_day_range_latency() -> None:
+    """
+    Indexing far into a business-day range should bisect the holidays
+    rather than walk the calendar.
+    """
+    target = business_days[100_000]
+    assert per_call(lambda: business_days[100_000], 1000) < 100e-6
+    assert per_call(lambda: business_days.index(target), 1000) < 100e-6
+
+
+def outages_and_windows(
+    count: int,
+) -> tuple[tempora.IntervalSet, tempora.IntervalSet]:
+    start = datetime.datetime(2024, 1, 1)
+    minute = datetime.timedelta(minutes=1)
+    outages = tempora.IntervalSet(
+        (start + minute * n, start + minute * (n + 2)) for n in range(0, count, 5)
+    )
+    windows = tempora.IntervalSet(
+        (start + minute * n, start + minute * (n + 30)) for n in range(0, count, 60)
+    )
+    return outages, windows
+
+
+def test_IntervalSet_intersection() -> None:
+    outages, windows = outages_and_windows(10**4)
+    overlap = outages & windows
+    assert overlap.total() == datetime.timedelta(minutes=2 * 6) * len(windows)
+
+
+@timed
+def test_IntervalSet_queries() -> None:
+    """
+    Point and window queries should bisect the endpoints, and set
+    operations should sweep them, rather than compare every pair.
+    """
+    outages, windows = outages_and_windows(10**6)
+    minute = datetime.timedelta(minutes=1)
+    moment = datetime.datetime(2024, 1, 1) + minute * 500_001
+    assert moment in outages
+    assert per_call(lambda: moment in outages) < 20e-6
+    assert per_call(lambda: outages.clip(moment, moment + minute * 20)) < 50e-6
+    assert per_call(lambda: outages - windows, 1) < 2.0
+
+
+reference_date = datetime.date(2019, 5, 20)
+julian_days = [day % 366 + 1 for day in range(100_000)]
+
+
+def gregorian_each() -> list[int]:
+    return [
+        tempora.gregorian_date(
+            tempora.get_nearest_year_for_day(day, reference_date), day
+        ).toordinal()
+        for day in julian_days
+    ]
+
+
+def test_gregorian_ordinals() -> None:
+    """
+    Converting a column of julian days with a shared reference time
+    should match converting each day.
+    """
+    result = tempora.gregorian_ordinals(julian_days, now=reference_date)
+    assert result.tolist() == gregorian_each()
+
+
+@timed
+def test_gregorian_ordinals_latency() -> None:
+    assert_faster(
+        lambda: tempora.gregorian_ordinals(julian_days, now=reference_date),
+        gregorian_each,
+        3,
+    )
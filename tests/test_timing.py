@@ -1,6 +1,11 @@
+import asyncio
+import concurrent.futures
 import contextlib
+import copy
 import datetime
+import itertools
 import os
+import threading
 import time
 from collections.abc import Generator
 from unittest import mock
@@ -51,3 +56,282 @@ def test_Stopwatch_timezone_change(
     watch = timing.Stopwatch()
     with alt_tz:
         assert abs(watch.split().total_seconds()) < 0.1
+
+
+limiters = pytest.mark.parametrize(
+    'limiter_class',
+    [timing.TokenBucket, timing.SlidingWindowLog, timing.SlidingWindowCounter],
+)
+
+
+@limiters
+def test_rate_limiter_decorate(limiter_class: type[timing.RateLimiter]) -> None:
+    """
+    A rate limiter should skip calls exceeding the limit.
+    """
+    func_under_test = mock.MagicMock()
+    func_under_test.__name__ = 'func_under_test'
+    governed = limiter_class(2, 60)(func_under_test)  # type: ignore[call-arg]
+    governed('a')
+    governed('b')
+    governed('c')
+    assert func_under_test.call_args_list == [mock.call('a'), mock.call('b')]
+
+
+@limiters
+@pytest.mark.parametrize('calls, period', [(0, 1), (1, 0), (1, -1)])
+def test_rate_limiter_invalid(
+    limiter_class: type[timing.RateLimiter], calls: int, period: float
+) -> None:
+    """
+    A limiter that could never admit a call should be rejected.
+    """
+    with pytest.raises(ValueError):
+        limiter_class(calls, period)  # type: ignore[call-arg]
+
+
+@limiters
+def test_rate_limiter_blocking(limiter_class: type[timing.RateLimiter]) -> None:
+    """
+    A blocking rate limiter should wait for the call to be admitted.
+    """
+    limiter = limiter_class(1, 0.05)  # type: ignore[call-arg]
+    assert limiter.acquire()
+    assert not limiter.acquire(blocking=False)
+    watch = timing.Stopwatch()
+    assert limiter.acquire()
+    assert watch.split() > datetime.timedelta(seconds=0.01)
+
+
+@limiters
+def test_rate_limiter_async(limiter_class: type[timing.RateLimiter]) -> None:
+    """
+    Coroutine functions should be limited without blocking the loop.
+    """
+    calls = []
+
+    @limiter_class(1, 0.05, blocking=True)  # type: ignore[call-arg]
+    async def func_under_test(value: int) -> int:
+        calls.append(value)
+        return value
+
+    async def main() -> list[int]:
+        return await asyncio.gather(func_under_test(1), func_under_test(2))
+
+    watch = timing.Stopwatch()
+    assert asyncio.run(main()) == [1, 2]
+    assert calls == [1, 2]
+    assert watch.split() > datetime.timedelta(seconds=0.01)
+
+
+def test_Timer_await_does_not_block() -> None:
+    """
+    Awaiting a Timer should let other tasks run until it expires.
+    """
+    ticks = []
+
+    async def ticker() -> None:
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.01)
+
+    async def main() -> None:
+        task = asyncio.create_task(ticker())
+        timer = timing.Timer(0.1)
+        await timer
+        assert timer.split() > datetime.timedelta(seconds=0.09)
+        task.cancel()
+
+    asyncio.run(main())
+    assert len(ticks) > 2
+
+
+def test_Timer_await_cancelled() -> None:
+    """
+    Cancelling a wait on a Timer should not leave a pending wakeup.
+    """
+
+    async def main() -> None:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(timing.Timer(), timeout=0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(timing.Timer(10).wait(), timeout=0.01)
+
+    asyncio.run(main())
+
+
+def test_Retry_async_deadline() -> None:
+    """
+    An async retry should cancel an attempt outlasting the deadline.
+    """
+    attempts: list[timing.Attempt] = []
+
+    async def slow() -> None:
+        await asyncio.sleep(10)
+
+    retry = timing.Retry(deadline=0.05, on_attempt=attempts.append)
+    watch = timing.Stopwatch()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(retry.call_async(slow))
+    assert watch.split() < datetime.timedelta(seconds=1)
+    assert attempts[-1].delay is None
+
+
+def test_Retry_predicate() -> None:
+    """
+    Retry only exceptions matching the predicate.
+    """
+    func_under_test = mock.MagicMock(
+        side_effect=[OSError(11, 'retry'), OSError(2, 'fail'), 'ok']
+    )
+    retry = timing.Retry(
+        retries=3, retry_on=lambda exc: getattr(exc, 'errno', None) == 11
+    )
+    with pytest.raises(OSError):
+        retry.call(func_under_test)
+    assert func_under_test.call_count == 2
+
+
+def test_Retry_defaults() -> None:
+    """
+    By default, a persistent failure is retried a few times, then raised.
+    """
+    func_under_test = mock.MagicMock(side_effect=ValueError)
+    with pytest.raises(ValueError):
+        timing.Retry().call(func_under_test)
+    assert func_under_test.call_count == 4
+
+
+def test_Retry_resets_backoff() -> None:
+    """
+    Each call should start from the initial delay.
+    """
+    attempts: list[timing.Attempt] = []
+    backoff = timing.BackoffDelay(delay=0.001, factor=2)
+    retry = timing.Retry(backoff, retries=2, on_attempt=attempts.append)
+    for _ in range(2):
+        with pytest.raises(ZeroDivisionError):
+            retry.call(lambda: 1 / 0)
+    delays = [attempt.delay for attempt in attempts]
+    assert delays == [0.001, 0.002, None] * 2
+    assert backoff.delay == 0.001
+
+
+@pytest.mark.parametrize('delay', [0, 0.5, 3])
+@pytest.mark.parametrize('factor', [0, 0.5, 1, 2])
+@pytest.mark.parametrize('limit', [0.25, 2, float('inf')])
+@pytest.mark.parametrize('jitter', [-0.25, 0, 0.75])
+def test_BackoffDelay_closed_form(
+    delay: float, factor: float, limit: float, jitter: float
+) -> None:
+    """
+    The closed-form delays should match those produced by iteration.
+    """
+    backoff = timing.BackoffDelay(delay, factor, limit, jitter)
+    iterated = list(itertools.islice(copy.copy(backoff), 20))
+    assert list(backoff.delays(20)) == pytest.approx(iterated)
+    assert list(backoff.cumulative(20)) == pytest.approx(
+        list(itertools.accumulate(iterated))
+    )
+    for count in range(20):
+        assert backoff.total(count) == pytest.approx(sum(iterated[:count]))
+
+
+def test_Deadline_asyncio_tasks() -> None:
+    """
+    Tasks should inherit the deadline in effect when they are created.
+    """
+
+    async def remaining() -> float:
+        return timing.Deadline.current().remaining()
+
+    async def main() -> None:
+        with timing.Deadline(30):
+            task = asyncio.create_task(remaining())
+        assert 29 < await task <= 30
+        assert await asyncio.create_task(remaining()) == float('inf')
+
+    asyncio.run(main())
+
+
+def test_Deadline_shared_by_tasks() -> None:
+    """
+    One deadline may be entered by several tasks at once.
+    """
+    shared = timing.Deadline(30)
+
+    async def enter(pause: float) -> float:
+        with shared as deadline:
+            await asyncio.sleep(pause)
+            assert timing.Deadline.current() is deadline
+        return timing.Deadline.current().remaining()
+
+    async def main() -> list[float]:
+        return await asyncio.gather(enter(0.02), enter(0.01))
+
+    assert asyncio.run(main()) == [float('inf')] * 2
+    assert shared.target == 30
+
+
+def test_Deadline_reentrant() -> None:
+    """
+    Entering a deadline within itself should unwind to each outer scope.
+    """
+    deadline = timing.Deadline(30)
+    with deadline as outer:
+        with deadline as inner:
+            assert timing.Deadline.current() is inner
+        assert timing.Deadline.current() is outer
+    assert timing.Deadline.current().remaining() == float('inf')
+
+
+def test_Deadline_entry_leaves_target() -> None:
+    """
+    Clamping to an enclosing deadline should not alter the deadline
+    entered, nor should entering the unbounded deadline.
+    """
+    deadline = timing.Deadline(60)
+    with timing.Deadline(30), deadline as clamped:
+        assert clamped.target <= 30
+    assert deadline.target == 60
+    with timing.Deadline.current():
+        pass
+    assert timing.Deadline.current().target == float('inf')
+
+
+def test_Deadline_thread_hop() -> None:
+    """
+    A deadline should only carry to another thread when bound.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor
+    with timing.Deadline(30) as deadline, executor() as pool:
+        unbound = pool.submit(timing.Deadline.current).result()
+        bound = pool.submit(timing.Deadline.bind(timing.Deadline.current))
+        assert bound.result() is deadline
+    assert unbound.remaining() == float('inf')
+
+
+def test_Deadline_bind_concurrently() -> None:
+    """
+    A bound function may run in several threads at once.
+    """
+    barrier = threading.Barrier(4)
+
+    def work(value: int) -> float:
+        barrier.wait(timeout=5)
+        return timing.Deadline.current().target
+
+    with timing.Deadline(30), concurrent.futures.ThreadPoolExecutor(4) as pool:
+        targets = list(pool.map(timing.Deadline.bind(work), range(4)))
+    assert targets == [30] * 4
+
+
+def test_Deadline_limits_Retry() -> None:
+    """
+    A Retry should give up when an enclosing deadline would be exceeded.
+    """
+    func_under_test = mock.MagicMock(side_effect=ValueError)
+    retry = timing.Retry(timing.BackoffDelay(delay=1))
+    with timing.Deadline(0.5), pytest.raises(ValueError):
+        retry.call(func_under_test)
+    func_under_test.assert_called_once()
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import abc
+import array
+import asyncio
+import bisect
 import collections.abc
 import contextlib
+import contextvars
+import copy
 import datetime
 import functools
+import inspect
+import itertools
+import math
 import numbers
+import random
+import threading
 import time
 from types import TracebackType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import jaraco.functools
 
@@ -115,6 +126,256 @@ class IntervalGovernor:
     __call__ = decorate
 
 
+def _seconds(period: datetime.timedelta | numbers.Number) -> float:
+    """
+    Accept a timedelta or a number of seconds, returning seconds.
+
+    >>> _seconds(datetime.timedelta(minutes=1))
+    60.0
+    >>> _seconds(2)
+    2.0
+    """
+    if isinstance(period, datetime.timedelta):
+        return period.total_seconds()
+    return float(period)  # type: ignore[arg-type]
+
+
+def _check_limit(calls: int, period: float) -> None:
+    if calls < 1:
+        raise ValueError("calls must be at least 1")
+    if period <= 0:
+        raise ValueError("period must be positive")
+
+
+class RateLimiter(abc.ABC):
+    """
+    Base for limiters admitting some number of calls per period.
+
+    Like :class:`IntervalGovernor`, decorate a function to limit
+    how often it is invoked. By default, a call that would exceed the
+    limit is skipped and returns None. Pass ``blocking=True`` to
+    instead wait until the call is admitted.
+
+    Subclasses implement ``_reserve``, which is called under a lock
+    with the current monotonic time and either admits a call
+    (returning 0) or returns the number of seconds to wait before
+    trying again.
+    """
+
+    def __init__(self, blocking: bool = False) -> None:
+        self.blocking = blocking
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _reserve(self, now: float) -> float: ...
+
+    def _attempt(self) -> float:
+        with self._lock:
+            return self._reserve(time.monotonic())
+
+    def try_acquire(self) -> bool:
+        """
+        Admit a call if the limit allows it, without waiting.
+        """
+        return not self._attempt()
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Admit a call, waiting (if ``blocking``) until the limit allows it.
+        Return whether the call was admitted.
+        """
+        while wait := self._attempt():
+            if not blocking:
+                return False
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self) -> None:
+        """
+        Admit a call, yielding to the event loop until the limit allows it.
+        """
+        while wait := self._attempt():
+            await asyncio.sleep(wait)
+
+    def decorate(
+        self, func: collections.abc.Callable[..., Any]
+    ) -> collections.abc.Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if self.blocking:
+                    await self.acquire_async()
+                elif not self.try_acquire():
+                    return None
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if self.acquire(self.blocking):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    __call__ = decorate
+
+
+class TokenBucket(RateLimiter):
+    """
+    Admit on average ``calls`` per ``period``, allowing bursts of up
+    to ``burst`` calls (default ``calls``).
+
+    The bucket starts full and refills continuously.
+
+    >>> freezer = getfixture('freezer')
+    >>> freezer.move_to('2020-01-01')
+    >>> bucket = TokenBucket(2, datetime.timedelta(seconds=1))
+    >>> bucket.try_acquire(), bucket.try_acquire(), bucket.try_acquire()
+    (True, True, False)
+    >>> _ = freezer.tick(0.5)
+    >>> bucket.try_acquire(), bucket.try_acquire()
+    (True, False)
+
+    Decorate a function to skip calls exceeding the limit.
+
+    >>> @TokenBucket(1, 60)
+    ... def ping():
+    ...     return 'pong'
+    >>> ping()
+    'pong'
+    >>> ping()
+
+    A bucket must hold at least one token.
+
+    >>> TokenBucket(1, 1, burst=0)
+    Traceback (most recent call last):
+    ...
+    ValueError: burst must be at least 1
+    """
+
+    def __init__(
+        self,
+        calls: int,
+        period: datetime.timedelta | numbers.Number,
+        burst: int | None = None,
+        blocking: bool = False,
+    ) -> None:
+        super().__init__(blocking)
+        seconds = _seconds(period)
+        _check_limit(calls, seconds)
+        self.capacity = calls if burst is None else burst
+        if self.capacity < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = calls / seconds
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    def _reserve(self, now: float) -> float:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+
+class SlidingWindowLog(RateLimiter):
+    """
+    Admit at most ``calls`` in any window of ``period``.
+
+    Exact: retains the times of the last ``calls`` admissions, so a
+    call is admitted only if the oldest of those has left the window.
+
+    >>> freezer = getfixture('freezer')
+    >>> freezer.move_to('2020-01-01')
+    >>> log = SlidingWindowLog(2, 10)
+    >>> log.try_acquire(), log.try_acquire(), log.try_acquire()
+    (True, True, False)
+    >>> _ = freezer.tick(9.9)
+    >>> log.try_acquire()
+    False
+    >>> _ = freezer.tick(0.1)
+    >>> log.try_acquire(), log.try_acquire()
+    (True, True)
+    """
+
+    def __init__(
+        self,
+        calls: int,
+        period: datetime.timedelta | numbers.Number,
+        blocking: bool = False,
+    ) -> None:
+        super().__init__(blocking)
+        self.period = _seconds(period)
+        _check_limit(calls, self.period)
+        self._log: collections.deque[float] = collections.deque(maxlen=calls)
+
+    def _reserve(self, now: float) -> float:
+        log = self._log
+        if len(log) == log.maxlen and (wait := log[0] + self.period - now) > 0:
+            return wait
+        log.append(now)
+        return 0
+
+
+class SlidingWindowCounter(RateLimiter):
+    """
+    Admit approximately ``calls`` in any window of ``period``.
+
+    Keeps only the counts for the current and previous fixed windows,
+    weighting the previous count by how much of it still overlaps the
+    sliding window. Uses constant memory regardless of ``calls``.
+
+    >>> freezer = getfixture('freezer')
+    >>> freezer.move_to('2020-01-01')
+    >>> counter = SlidingWindowCounter(2, 10)
+    >>> counter.try_acquire(), counter.try_acquire(), counter.try_acquire()
+    (True, True, False)
+    >>> _ = freezer.tick(10)
+    >>> counter.try_acquire()
+    False
+    >>> _ = freezer.tick(5)
+    >>> counter.try_acquire(), counter.try_acquire()
+    (True, False)
+    """
+
+    def __init__(
+        self,
+        calls: int,
+        period: datetime.timedelta | numbers.Number,
+        blocking: bool = False,
+    ) -> None:
+        super().__init__(blocking)
+        self.calls = calls
+        self.period = _seconds(period)
+        _check_limit(calls, self.period)
+        self._window = time.monotonic() // self.period
+        self._current = 0
+        self._previous = 0
+
+    def _reserve(self, now: float) -> float:
+        window, offset = divmod(now, self.period)
+        if window != self._window:
+            adjacent = window == self._window + 1
+            self._previous = self._current if adjacent else 0
+            self._current = 0
+            self._window = window
+        overlap = 1 - offset / self.period
+        if self._previous * overlap + self._current + 1 <= self.calls:
+            self._current += 1
+            return 0
+        room = self.calls - 1 - self._current
+        if room < 0 or not self._previous:
+            # wait for the next window
+            return self.period - offset
+        # wait until enough of the previous window has slid out
+        needed = 1 - room / self._previous
+        return max((needed - offset / self.period) * self.period, 1e-6)
+
+
 class Timer(Stopwatch):
     """
     Watch for a target elapsed time.
@@ -125,6 +386,15 @@ class Timer(Stopwatch):
     >>> __import__('time').sleep(0.15)
     >>> t.expired()
     True
+
+    In a coroutine, await the timer to suspend until it expires
+    without polling or blocking the event loop.
+
+    >>> async def main():
+    ...     await Timer(0.01)
+    ...     return 'done'
+    >>> asyncio.run(main())
+    'done'
     """
 
     def __init__(
@@ -155,6 +425,198 @@ class Timer(Stopwatch):
     def expired(self) -> bool:
         return self.split().total_seconds() > self.target
 
+    def remaining(self) -> float:
+        """
+        Seconds until the target elapses (negative once expired).
+
+        >>> Timer().remaining()
+        inf
+        >>> 29 < Timer(30).remaining() <= 30
+        True
+        """
+        return self.target - self.split().total_seconds()
+
+    async def wait(self) -> None:
+        """
+        Suspend until the timer expires, scheduling the wakeup
+        with the running loop's ``call_at``.
+
+        An infinite target waits until cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        expiry = loop.create_future()
+        remaining = self.remaining()
+        if remaining == float('Inf'):
+            await expiry
+            return
+        handle = loop.call_at(loop.time() + remaining, expiry.set_result, None)
+        try:
+            await expiry
+        finally:
+            handle.cancel()
+
+    def __await__(self) -> collections.abc.Generator[Any, None, None]:
+        return self.wait().__await__()
+
+
+class Deadline(Timer):
+    """
+    A Timer that, entered as a context, bounds the time available to
+    all code running in that context.
+
+    Code anywhere down the call stack may consult the innermost
+    deadline with :meth:`current` to abandon work that cannot
+    finish in time.
+
+    >>> Deadline.current().remaining()
+    inf
+    >>> with Deadline(30):
+    ...     29 < Deadline.current().remaining() <= 30
+    True
+
+    Entering yields a copy scoped to the block; a nested deadline
+    is clamped to its parent.
+
+    >>> with Deadline(30), Deadline(60) as inner:
+    ...     inner.target <= 30
+    True
+    >>> with Deadline(0.01):
+    ...     __import__('time').sleep(0.02)
+    ...     Deadline.current().check()
+    Traceback (most recent call last):
+    ...
+    TimeoutError: Deadline exceeded by ...
+
+    Being based on :mod:`contextvars`, the deadline carries into
+    asyncio tasks. Use :meth:`bind` to carry it to another thread.
+
+    >>> import concurrent.futures
+    >>> with Deadline(30), concurrent.futures.ThreadPoolExecutor() as pool:
+    ...     pool.submit(Deadline.bind(Deadline.current)).result().target
+    30
+    """
+
+    def start(self) -> None:
+        super().start()
+        self._expiry = self._start + self.target
+
+    def remaining(self) -> float:
+        return self._expiry - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() < 0
+
+    def check(self, needed: float | datetime.timedelta = 0) -> None:
+        """
+        Raise TimeoutError unless at least ``needed`` remains.
+        """
+        remaining = self.remaining()
+        if remaining < self._accept(needed):
+            raise TimeoutError(f"Deadline exceeded by {-remaining:.3g}s")
+
+    def __enter__(self) -> Self:
+        """
+        Make a started copy of this deadline, clamped to the current
+        one, the current deadline for the block and return it.
+
+        This deadline is left untouched, so it may be entered again,
+        re-entrantly or from concurrent tasks.
+        """
+        scope = copy.copy(self)
+        scope.target = min(self.target, self.current().remaining())
+        scope.reset()
+        scope.start()
+        scope._entered = self, _current_deadline.set(scope)
+        return scope
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        scope = _current_deadline.get(_unbounded)
+        entered, token = getattr(scope, '_entered', (None, None))
+        if entered is not self:
+            raise RuntimeError("Deadline exited out of order")
+        _current_deadline.reset(token)
+        scope.stop()
+
+    @staticmethod
+    def current() -> Deadline:
+        """
+        Return the innermost deadline in effect (unbounded if none).
+        """
+        return _current_deadline.get(_unbounded)
+
+    @staticmethod
+    def bind(
+        func: collections.abc.Callable[..., Any],
+    ) -> collections.abc.Callable[..., Any]:
+        """
+        Bind func to a copy of the current context, including its
+        deadline, for calling in another thread.
+
+        Each call runs in its own copy of that context, so the bound
+        function may be called concurrently.
+        """
+        context = contextvars.copy_context()
+
+        @functools.wraps(func)
+        def bound(*args: Any, **kwargs: Any) -> Any:
+            return context.copy().run(func, *args, **kwargs)
+
+        return bound
+
+
+_unbounded = Deadline()
+_current_deadline: contextvars.ContextVar[Deadline] = contextvars.ContextVar('deadline')
+
+
+def _clamp(limit: float, n: float, /) -> float:
+    return max(0, min(limit, n))
+
+
+def _constant(value: float, /) -> float:
+    return value
+
+
+def _affine_term(start: float, factor: float, step: float, n: int) -> float:
+    """
+    Return the nth iterate of ``x * factor + step`` from ``start``.
+
+    >>> _affine_term(1, 2, 1, 3)
+    15.0
+    >>> _affine_term(1, 1, 0.5, 4)
+    3.0
+    """
+    if factor == 1:
+        return start + step * n
+    try:
+        growth = factor**n
+    except OverflowError:
+        return float('inf')
+    return start * growth + step * (growth - 1) / (factor - 1)
+
+
+def _affine_sum(start: float, factor: float, step: float, n: int) -> float:
+    """
+    Return the sum of the first n iterates (from the 0th) of
+    ``x * factor + step`` from ``start``.
+
+    >>> _affine_sum(1, 2, 1, 4)
+    26.0
+    >>> _affine_sum(1, 1, 0.5, 3)
+    4.5
+    """
+    if factor == 1:
+        return start * n + step * n * (n - 1) / 2
+    try:
+        geometric = (factor**n - 1) / (factor - 1)
+    except OverflowError:
+        return float('inf')
+    return start * geometric + step * (geometric - n) / (factor - 1)
+
 
 class BackoffDelay(collections.abc.Iterator[int | float]):
     """
@@ -252,31 +714,32 @@ class BackoffDelay(collections.abc.Iterator[int | float]):
     ) -> None:
         self.delay = delay
         self.factor = factor
-        if isinstance(limit, numbers.Number):
-            limit_ = limit
-
-            def limit_func(n: float, /) -> float:
-                return max(0, min(limit_, n))
-
-        else:
-            # python/mypy#16946 or # python/mypy#13914
-            limit_func: collections.abc.Callable[[float], float] = limit  # type: ignore[no-redef]
-        self.limit = limit_func
-        if isinstance(jitter, numbers.Number):
-            jitter_ = jitter
-
-            def jitter_func() -> float:
-                return jitter_
-
-        else:
-            # python/mypy#16946 or # python/mypy#13914
-            jitter_func: collections.abc.Callable[[], float] = jitter  # type: ignore[no-redef]
-
-        self.jitter = jitter_func
+        self.limit = (
+            functools.partial(_clamp, limit)
+            if isinstance(limit, numbers.Number)
+            else limit
+        )
+        self.jitter = (
+            functools.partial(_constant, jitter)
+            if isinstance(jitter, numbers.Number)
+            else jitter
+        )
 
     def __call__(self) -> None:
         time.sleep(next(self))
 
+    async def async_sleep(self) -> None:
+        """
+        Like calling the delay, but suspend the current coroutine
+        rather than blocking the thread.
+
+        >>> bd = BackoffDelay(delay=0.01, factor=2)
+        >>> asyncio.run(bd.async_sleep())
+        >>> bd.delay
+        0.02
+        """
+        await asyncio.sleep(next(self))
+
     def __next__(self) -> int | float:
         delay = self.delay
         self.bump()
@@ -291,3 +754,366 @@ class BackoffDelay(collections.abc.Iterator[int | float]):
     def reset(self) -> None:
         saved = self._saved___init__  # type: ignore[attr-defined]
         self.__init__(*saved.args, **saved.kwargs)  # type: ignore[misc]
+
+    def _affine(self) -> tuple[float, float, float] | None:
+        """
+        If the delays follow ``x * factor + jitter`` clamped to
+        ``limit`` for numeric (non-negative) factor, jitter and limit,
+        return those parameters.
+        """
+        cls = type(self)
+        numeric = (
+            cls.bump is BackoffDelay.bump
+            and cls.__next__ is BackoffDelay.__next__
+            and getattr(self.limit, 'func', None) is _clamp
+            and getattr(self.jitter, 'func', None) is _constant
+            and self.factor >= 0
+        )
+        if not numeric:
+            return None
+        (limit,) = self.limit.args  # type: ignore[attr-defined]
+        (jitter,) = self.jitter.args  # type: ignore[attr-defined]
+        return self.factor, jitter, limit
+
+    def _plan(self, count: int) -> tuple[collections.abc.Callable[[int], float], int]:
+        """
+        For numeric parameters, return a function computing the nth
+        delay directly and the number of delays (up to ``count``)
+        that precede the sequence settling on a bound.
+        """
+        factor, jitter, limit = self._affine()  # type: ignore[misc]
+        # After the first delay, the delays lie within the bounds and,
+        # because ``x * factor + jitter`` is monotonic, proceed
+        # monotonically until they reach a bound and remain there.
+        start = _clamp(limit, self.delay * factor + jitter)
+
+        def term(n: int) -> float:
+            return _affine_term(start, factor, jitter, n)
+
+        def out_of_bounds(n: int) -> bool:
+            return not 0 <= term(n) <= limit
+
+        settled = bisect.bisect_left(range(1, count), True, key=out_of_bounds) + 1
+        bound = limit if term(settled) > limit else 0
+
+        def nth(n: int) -> float:
+            if not n:
+                return self.delay
+            return term(n - 1) if n <= settled else bound
+
+        return nth, settled
+
+    def delays(self, count: int) -> array.array[float]:
+        """
+        Return the next ``count`` delays without advancing.
+
+        >>> bd = BackoffDelay(delay=0.01, factor=2, limit=0.05)
+        >>> bd.delays(5)
+        array('d', [0.01, 0.02, 0.04, 0.05, 0.05])
+        >>> bd.delay
+        0.01
+
+        With numeric limit and jitter, each delay is computed in
+        closed form, so planning far ahead is cheap.
+
+        >>> BackoffDelay(delay=1, factor=1.5, limit=60).delays(10**6)[-1]
+        60.0
+
+        Otherwise, the delays are sampled from a copy of this backoff.
+
+        >>> BackoffDelay(delay=1, limit=lambda n: n + 1).delays(3)
+        array('d', [1.0, 2.0, 3.0])
+        """
+        if self._affine() is None:
+            return array.array('d', itertools.islice(copy.copy(self), count))
+        nth, _ = self._plan(count)
+        return array.array('d', map(nth, range(count)))
+
+    def cumulative(self, count: int) -> array.array[float]:
+        """
+        Return the running totals of the next ``count`` delays.
+
+        >>> BackoffDelay(delay=1, factor=2, limit=5).cumulative(5)
+        array('d', [1.0, 3.0, 7.0, 12.0, 17.0])
+        """
+        return array.array('d', itertools.accumulate(self.delays(count)))
+
+    def total(self, count: int) -> float:
+        """
+        Return the sum of the next ``count`` delays, that is, the total
+        delay incurred before attempt ``count + 1``.
+
+        >>> BackoffDelay(delay=1, factor=2, limit=5).total(5)
+        17.0
+        >>> BackoffDelay(delay=1, factor=2, jitter=1).total(4)
+        26.0
+        >>> BackoffDelay(delay=0.5, factor=1.5, limit=60).total(10**9)
+        59999999...
+        """
+        if self._affine() is None or count < 1:
+            return math.fsum(self.delays(count))
+        factor, jitter, _ = self._affine()  # type: ignore[misc]
+        nth, settled = self._plan(count)
+        start = nth(1) if count > 1 else 0
+        growing = min(settled, count - 1)
+        return (
+            self.delay
+            + _affine_sum(start, factor, jitter, growing)
+            + nth(count - 1) * (count - 1 - growing)
+        )
+
+
+class FullJitterDelay(BackoffDelay):
+    """
+    Backoff delay with "full jitter": each delay is drawn uniformly
+    between zero and the exponential backoff delay.
+
+    >>> bd = FullJitterDelay(delay=1, factor=2)
+    >>> 0 <= next(bd) <= 1
+    True
+    >>> 0 <= next(bd) <= 2
+    True
+    >>> bd.delay
+    4
+    """
+
+    def __next__(self) -> float:
+        return random.uniform(0, super().__next__())
+
+
+class DecorrelatedJitterDelay(BackoffDelay):
+    """
+    Backoff delay with "decorrelated jitter": each delay is drawn
+    uniformly between the initial delay and ``factor`` (default 3)
+    times the previous delay, subject to ``limit``.
+
+    >>> bd = DecorrelatedJitterDelay(delay=1, limit=5)
+    >>> next(bd)
+    1
+    >>> 1 <= next(bd) <= 3
+    True
+    >>> all(1 <= next(bd) <= 5 for _ in range(10))
+    True
+    >>> bd.reset()
+    >>> bd.delay
+    1
+
+    The jitter is relative to the initial delay, so it must be positive.
+
+    >>> DecorrelatedJitterDelay(delay=0)
+    Traceback (most recent call last):
+    ...
+    ValueError: delay must be positive
+    """
+
+    def __init__(
+        self,
+        delay: float = 1,
+        factor: float = 3,
+        limit: collections.abc.Callable[[float], float] | float = float('inf'),
+    ) -> None:
+        if delay <= 0:
+            raise ValueError("delay must be positive")
+        super().__init__(delay, factor, limit)
+        self.base = delay
+
+    def bump(self) -> None:
+        self.delay = self.limit(random.uniform(self.base, self.delay * self.factor))
+
+    def reset(self) -> None:
+        self.delay = self.base
+
+
+class Attempt(NamedTuple):
+    """
+    The outcome of a single call made by :class:`Retry`.
+    """
+
+    number: int
+    "1-based index of the attempt"
+
+    elapsed: datetime.timedelta
+    "Time spent in the call"
+
+    exception: BaseException | None
+    "The exception raised by the call, if any"
+
+    delay: float | None
+    "Seconds to wait before the next attempt, or None if none will be made"
+
+
+class Retry:
+    """
+    Call a function, retrying failures after delays from ``backoff``
+    (none by default) until it succeeds, ``retries`` (3 by default)
+    are exhausted, or the ``deadline`` budget is spent.
+
+    The deadline (seconds or timedelta), further limited by any
+    enclosing :class:`Deadline`, bounds the total time taken:
+    no retry is attempted if its delay would outlast the remaining
+    budget, and async calls are cancelled when the budget expires.
+
+    ``retry_on`` may be an exception type, a tuple of types, or a
+    predicate taking the exception; other exceptions are raised
+    immediately. After each attempt, ``on_attempt`` is called with an
+    :class:`Attempt` describing it.
+
+    >>> flaky = iter([ValueError(), ValueError(), 'ok'])
+    >>> def fetch():
+    ...     result = next(flaky)
+    ...     if isinstance(result, Exception):
+    ...         raise result
+    ...     return result
+    >>> retry = Retry(BackoffDelay(delay=0.01), on_attempt=print)
+    >>> retry.call(fetch)
+    Attempt(number=1, ..., exception=ValueError(), delay=0.01)
+    Attempt(number=2, ..., exception=ValueError(), delay=0.01)
+    Attempt(number=3, ..., exception=None, delay=None)
+    'ok'
+
+    Decorate a function (or coroutine function) to retry it.
+
+    >>> @Retry(retries=2, retry_on=KeyError)
+    ... def lookup(key):
+    ...     return {}[key]
+    >>> lookup('missing')
+    Traceback (most recent call last):
+    ...
+    KeyError: 'missing'
+
+    Without a limit on retries or a deadline, there must be a delay
+    (lest a persistent failure be retried in a busy loop).
+
+    >>> Retry(retries=float('inf'))
+    Traceback (most recent call last):
+    ...
+    ValueError: Unbounded retries require a deadline or a delay
+
+    The deadline is honored even when retries remain.
+
+    >>> retry = Retry(BackoffDelay(delay=1), deadline=0.5)
+    >>> retry.call(lookup.__wrapped__, 'missing')
+    Traceback (most recent call last):
+    ...
+    KeyError: 'missing'
+    """
+
+    def __init__(
+        self,
+        backoff: BackoffDelay | None = None,
+        deadline: float | datetime.timedelta | None = None,
+        retries: float = 3,
+        retry_on: type[BaseException]
+        | tuple[type[BaseException], ...]
+        | collections.abc.Callable[[BaseException], bool] = Exception,
+        on_attempt: collections.abc.Callable[[Attempt], object] | None = None,
+    ) -> None:
+        self.backoff = backoff or BackoffDelay()
+        if retries == float('inf') and deadline is None and self._spins(self.backoff):
+            raise ValueError("Unbounded retries require a deadline or a delay")
+        self.deadline = deadline
+        self.retries = retries
+        self.retryable = self._predicate(retry_on)
+        self.on_attempt = on_attempt or (lambda attempt: None)
+
+    @staticmethod
+    def _spins(backoff: BackoffDelay) -> bool:
+        """
+        Whether backoff would retry immediately, every time.
+        """
+        affine = backoff._affine()
+        return affine is not None and not backoff.delay and affine[1] <= 0
+
+    @staticmethod
+    def _predicate(
+        retry_on: type[BaseException]
+        | tuple[type[BaseException], ...]
+        | collections.abc.Callable[[BaseException], bool],
+    ) -> collections.abc.Callable[[BaseException], bool]:
+        if isinstance(retry_on, (type, tuple)):
+            return lambda exc: isinstance(exc, retry_on)
+        return retry_on
+
+    def _start(self) -> tuple[BackoffDelay, Timer]:
+        """
+        Begin a fresh backoff and deadline budget for one call.
+        """
+        backoff = copy.copy(self.backoff)
+        backoff.reset()
+        budget = min(Timer._accept(self.deadline), Deadline.current().remaining())
+        return backoff, Timer(budget)
+
+    def _delay_after(
+        self, exc: BaseException, number: int, backoff: BackoffDelay, budget: Timer
+    ) -> float | None:
+        """
+        Return the delay before the next attempt or None to give up.
+        """
+        if not self.retryable(exc) or number > self.retries:
+            return None
+        delay = next(backoff)
+        return delay if delay < budget.remaining() else None
+
+    def call(
+        self, func: collections.abc.Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        backoff, budget = self._start()
+        number = 0
+        while True:
+            number += 1
+            watch = Stopwatch()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as exc:
+                delay = self._delay_after(exc, number, backoff, budget)
+                self.on_attempt(Attempt(number, watch.split(), exc, delay))
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            else:
+                self.on_attempt(Attempt(number, watch.split(), None, None))
+                return result
+
+    async def call_async(
+        self,
+        func: collections.abc.Callable[..., collections.abc.Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        backoff, budget = self._start()
+        number = 0
+        while True:
+            number += 1
+            watch = Stopwatch()
+            remaining = budget.remaining()
+            timeout = None if remaining == float('Inf') else max(remaining, 0)
+            try:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout)
+            except Exception as exc:
+                delay = self._delay_after(exc, number, backoff, budget)
+                self.on_attempt(Attempt(number, watch.split(), exc, delay))
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                self.on_attempt(Attempt(number, watch.split(), None, None))
+                return result
+
+    def decorate(
+        self, func: collections.abc.Callable[..., Any]
+    ) -> collections.abc.Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await self.call_async(func, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.call(func, *args, **kwargs)
+
+        return wrapper
+
+    __call__ = decorate